@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory held by normalized catalog records (nested dicts vs slotted,
+interned records) and the size of the plain vs dictionary-encoded products JSON
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from catalog_records import Product
+from catalog_encoding import encode_products, decode_products
+
+
+def legacy_product(product, description):
+    """The nested-dict normalization process_product used before catalog_records"""
+    processed = {
+        'id': product.get('id'),
+        'title': product.get('title'),
+        'handle': product.get('handle'),
+        'description': description,
+        'vendor': product.get('vendor'),
+        'product_type': product.get('product_type'),
+        'created_at': product.get('created_at'),
+        'updated_at': product.get('updated_at'),
+        'published_at': product.get('published_at'),
+        'tags': product.get('tags', []),
+        'available': product.get('available'),
+        'price_range': {'min': None, 'max': None},
+        'variants': [],
+        'images': [],
+        'options': product.get('options', []),
+        'seo': {'title': product.get('title'), 'description': description[:160]}
+    }
+    prices = []
+    for variant in product.get('variants', []):
+        variant_data = {
+            'id': variant.get('id'),
+            'title': variant.get('title'),
+            'price': float(variant.get('price', 0)),
+            'compare_at_price': variant.get('compare_at_price'),
+            'sku': variant.get('sku'),
+            'inventory_quantity': variant.get('inventory_quantity'),
+            'available': variant.get('available'),
+            'weight': variant.get('weight'),
+            'option1': variant.get('option1'),
+            'option2': variant.get('option2'),
+            'option3': variant.get('option3')
+        }
+        processed['variants'].append(variant_data)
+        if variant_data['price'] > 0:
+            prices.append(variant_data['price'])
+    if prices:
+        processed['price_range'] = {'min': min(prices), 'max': max(prices)}
+    for image in product.get('images', []):
+        processed['images'].append({
+            'id': image.get('id'),
+            'src': image.get('src'),
+            'alt': image.get('alt', ''),
+            'position': image.get('position'),
+            'width': image.get('width'),
+            'height': image.get('height'),
+            'variant_ids': image.get('variant_ids', [])
+        })
+    return processed
+
+
+def api_product(i, variants, images):
+    """Shopify products.json record as raw JSON, decoded per product like the streaming parser"""
+    lengths = ['12"', '14"', '16"', '18"', '20"', '22"', '24"']
+    return json.dumps({
+        'id': 7000000000 + i,
+        'title': f'Silky Straight Bundle {i}',
+        'handle': f'silky-straight-bundle-{i}',
+        'vendor': 'Bad Boujee Hair',
+        'product_type': 'Bundles',
+        'created_at': '2024-03-01T10:00:00-05:00',
+        'updated_at': '2025-01-15T10:00:00-05:00',
+        'published_at': '2024-03-01T10:00:00-05:00',
+        'tags': ['virgin hair', 'straight', 'bundles', 'best seller'],
+        'available': True,
+        'options': [{'name': 'Length', 'position': 1, 'values': lengths}],
+        'variants': [{
+            'id': 40000000000 + i * 100 + v, 'title': lengths[v % len(lengths)], 'price': f'{89 + v * 10}.00',
+            'compare_at_price': None, 'sku': f'SSB-{i}-{v}', 'inventory_quantity': 10, 'available': True,
+            'weight': 0.2, 'option1': lengths[v % len(lengths)], 'option2': None, 'option3': None
+        } for v in range(variants)],
+        'images': [{
+            'id': 30000000000 + i * 100 + k, 'position': k + 1, 'alt': None, 'width': 1200, 'height': 1200,
+            'src': f'https://cdn.shopify.com/s/files/1/0612/3456/7890/products/bundle_{i}_{k}.jpg?v=1700000000',
+            'variant_ids': []
+        } for k in range(images)]
+    })
+
+
+def measure(build, payloads):
+    """Return the records and the bytes they keep alive once each payload is dropped"""
+    gc.collect()
+    tracemalloc.start()
+    records = [build(json.loads(raw), 'Premium 100% virgin human hair.') for raw in payloads]
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return records, current
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark catalog record memory")
+    parser.add_argument('--products', type=int, default=5000, help="Number of products")
+    parser.add_argument('--variants', type=int, default=6, help="Variants per product")
+    parser.add_argument('--images', type=int, default=5, help="Images per product")
+    args = parser.parse_args()
+
+    payloads = [api_product(i, args.variants, args.images) for i in range(args.products)]
+    legacy, legacy_bytes = measure(legacy_product, payloads)
+    records, record_bytes = measure(Product.from_api, payloads)
+
+    exported = [product.to_dict() for product in records]
+    assert exported == legacy, "records must export the legacy schema"
+
+    plain = json.dumps(exported, ensure_ascii=False)
+    encoded = json.dumps(encode_products(exported), ensure_ascii=False)
+    assert decode_products(json.loads(encoded)) == json.loads(plain), "encoding must round-trip"
+
+    print(f"{args.products} products x {args.variants} variants x {args.images} images")
+    print(f"  memory  dicts:   {legacy_bytes / 1e6:8.2f} MB  ({legacy_bytes / args.products:8.0f} B/product)")
+    print(f"  memory  records: {record_bytes / 1e6:8.2f} MB  ({record_bytes / args.products:8.0f} B/product)"
+          f"  {(1 - record_bytes / legacy_bytes) * 100:5.1f}% less")
+    print(f"  output  plain:   {len(plain) / 1e6:8.2f} MB")
+    print(f"  output  encoded: {len(encoded) / 1e6:8.2f} MB"
+          f"  {(1 - len(encoded) / len(plain)) * 100:5.1f}% smaller")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass homepage scanner against the previous regex extraction
+"""
+
+import argparse
+import re
+import time
+from html_scanner import scan_html
+
+# The four independent regexes scrape_homepage used before html_scanner
+LEGACY_PATTERNS = [
+    (r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL),
+    (r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', re.IGNORECASE),
+    (r'<img[^>]*src=["\']([^"\']*)["\'][^>]*alt=["\']([^"\']*)["\']', re.IGNORECASE),
+    (r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+]
+
+
+def legacy_scan(page):
+    return [re.findall(pattern, page, flags) for pattern, flags in LEGACY_PATTERNS]
+
+
+def typical_page(size):
+    """Shopify-like homepage: product grid, lazy images, picture sources, scripts"""
+    head = (
+        '<!doctype html><html><head><title>Bad Boujee Hair &amp; Co</title>'
+        '<meta name="description" content="Luxury hair extensions">'
+        '<meta property="og:image" content="//cdn.shopify.com/og.jpg">'
+        '<script type="application/ld+json">{"@type": "Organization", "name": "Bad Boujee Hair"}</script>'
+        '</head><body>'
+    )
+    card = (
+        '<div class="product-card"><a href="/products/silky-straight-{i}">'
+        '<picture><source srcset="//cdn.shopify.com/p{i}_400x.webp 400w, //cdn.shopify.com/p{i}_800x.webp 800w" type="image/webp">'
+        '<img alt="Silky straight {i}" class="lazy" data-src="//cdn.shopify.com/p{i}_800x.jpg" width="800" height="800"></picture>'
+        '<h3 class="title">Silky Straight Bundle {i}</h3><span class="price">$129.00</span>'
+        '<script>window.dataLayer.push({{"id": {i}, "price": 129}});</script></a></div>\n'
+    )
+    parts = [head]
+    total = len(head)
+    i = 0
+    while total < size:
+        parts.append(card.format(i=i))
+        total += len(parts[-1])
+        i += 1
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def adversarial_page(size):
+    """Run of img tags whose '>' never comes, e.g. markup cut off inside an inline template"""
+    tag = '<img src="/a.jpg" class=lazy '
+    return '<html><body>' + tag * (size // len(tag))
+
+
+def timed(scan, page, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = scan(page)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def benchmark(name, page, repeat, regex_limit=None):
+    # The legacy img regex is super-linear on unclosed tags, so it only sees a prefix there
+    regex_page = page[:regex_limit] if regex_limit else page
+    regex_time, legacy = timed(legacy_scan, regex_page, repeat)
+    scanner_time, found = timed(scan_html, page, repeat)
+
+    print(f"{name:<12} {len(page) / 1e6:6.1f} MB  "
+          f"scanner {scanner_time * 1000:8.1f} ms ({len(found.images)} imgs, "
+          f"{len(found.meta)} meta, {len(found.json_ld)} json-ld)  "
+          f"regex {regex_time * 1000:8.1f} ms on {len(regex_page) / 1e3:.0f} KB ({len(legacy[2])} imgs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark homepage HTML extraction")
+    parser.add_argument('--sizes', default='1,4,16', help="Comma-separated page sizes in MB")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement")
+    parser.add_argument('--regex-limit', type=int, default=8000, help="Bytes of the adversarial page given to the legacy regexes")
+    args = parser.parse_args()
+
+    for size_mb in (float(size) for size in args.sizes.split(',')):
+        size = int(size_mb * 1e6)
+        benchmark('typical', typical_page(size), args.repeat)
+        benchmark('adversarial', adversarial_page(size), args.repeat, args.regex_limit)
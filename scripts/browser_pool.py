@@ -0,0 +1,98 @@
+"""
+Bounded pool of parallel WebDriver workers
+
+Each worker thread owns one browser and pulls jobs from a shared queue.
+A browser is recycled after a fixed number of pages to cap memory growth,
+and a worker whose browser crashes starts a fresh one and retries the job.
+"""
+
+import queue
+import threading
+
+_STOP = object()
+
+
+class BrowserPool:
+    """Run visit(driver, job) for each job across N browser workers"""
+
+    def __init__(self, driver_factory, size=3, pages_per_driver=25, max_attempts=2):
+        self.driver_factory = driver_factory
+        self.size = size
+        self.pages_per_driver = pages_per_driver
+        self.max_attempts = max_attempts
+
+    def run(self, jobs, visit):
+        """Yield (job, result) as jobs finish; result is None if every attempt failed"""
+        jobs = list(jobs)
+        if not jobs:
+            return
+
+        work = queue.Queue()
+        results = queue.Queue()
+        for job in jobs:
+            work.put((job, 1))
+
+        workers = [
+            threading.Thread(target=self._worker, args=(work, results, visit), daemon=True)
+            for _ in range(min(self.size, len(jobs)))
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for _ in range(len(jobs)):
+                yield results.get()
+        finally:
+            for _ in workers:
+                work.put(_STOP)
+            for worker in workers:
+                worker.join()
+
+    def _worker(self, work, results, visit):
+        from selenium.common.exceptions import WebDriverException
+
+        driver = None
+        pages = 0
+        try:
+            while True:
+                item = work.get()
+                if item is _STOP:
+                    return
+                job, attempt = item
+
+                try:
+                    if driver is None:
+                        driver = self.driver_factory()
+                        pages = 0
+                    result = visit(driver, job)
+                except WebDriverException as e:
+                    # Treat driver errors as a crash: discard the browser and retry elsewhere
+                    self._quit(driver)
+                    driver = None
+                    if attempt < self.max_attempts:
+                        print(f"    ⚠️ Browser failed on {job}, retrying: {e.msg or e}")
+                        work.put((job, attempt + 1))
+                    else:
+                        print(f"    ❌ Giving up on {job}: {e.msg or e}")
+                        results.put((job, None))
+                    continue
+                except Exception as e:
+                    print(f"    ❌ Error scraping {job}: {e}")
+                    results.put((job, None))
+                    continue
+
+                results.put((job, result))
+                pages += 1
+                if pages >= self.pages_per_driver:
+                    self._quit(driver)
+                    driver = None
+        finally:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,192 @@
+"""
+Dictionary encoding for repeated catalog values (standard library only)
+
+Vendors, product types, tags, option names and values repeat across
+thousands of products and variants, and every image URL starts with the
+same long cdn.shopify.com/s/files/1/... prefix. StringTable interns those
+values so each distinct string is held once, and UrlTable stores a URL as
+a prefix id plus the file name after it.
+
+encode_products turns the products JSON into a compact form with those
+values replaced by table ids; decode_products rebuilds the original JSON
+exactly. Run this module on an encoded file to print the decoded products.
+"""
+
+import json
+import sys
+
+ENCODING_FORMAT = 'catalog-dict/1'
+
+
+class StringTable:
+    """Interned strings, each with a stable integer id"""
+
+    def __init__(self, strings=()):
+        self.strings = []
+        self._ids = {}
+        for value in strings:
+            self.id_of(value)
+
+    def id_of(self, value):
+        """Return the id of a string, adding it to the table if needed"""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def intern(self, value):
+        """Return the table's instance of an equal string; non-strings pass through"""
+        if not isinstance(value, str):
+            return value
+        return self.strings[self.id_of(value)]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class UrlTable:
+    """URLs split into a shared prefix (up to the last '/') and a suffix"""
+
+    def __init__(self, prefixes=()):
+        self.prefixes = StringTable(prefixes)
+
+    def split(self, url):
+        """Return (prefix_id, suffix) for a URL; None stays (None, None)"""
+        if url is None:
+            return None, None
+        cut = url.rfind('/') + 1
+        return self.prefixes.id_of(url[:cut]), url[cut:]
+
+    def join(self, prefix_id, suffix):
+        """Rebuild a URL from split()"""
+        if prefix_id is None:
+            return None
+        return self.prefixes.strings[prefix_id] + suffix
+
+
+# Shared by every record built in this process
+STRINGS = StringTable()
+URLS = UrlTable()
+
+
+def intern_options(options, strings=STRINGS):
+    """Return product options with names and values interned"""
+    return tuple(
+        {**option, 'name': strings.intern(option.get('name')),
+         'values': [strings.intern(value) for value in option.get('values', ())]}
+        if isinstance(option, dict) else strings.intern(option)
+        for option in options
+    )
+
+
+def _encode_option(option, strings):
+    if not isinstance(option, dict):
+        return strings.id_of(option) if isinstance(option, str) else option
+    encoded = dict(option)
+    if isinstance(option.get('name'), str):
+        encoded['name'] = strings.id_of(option['name'])
+    if 'values' in option:
+        encoded['values'] = [strings.id_of(value) for value in option['values']]
+    return encoded
+
+
+def _decode_option(option, strings):
+    if not isinstance(option, dict):
+        return strings[option] if isinstance(option, int) else option
+    decoded = dict(option)
+    if isinstance(option.get('name'), int):
+        decoded['name'] = strings[option['name']]
+    if 'values' in option:
+        decoded['values'] = [strings[value] for value in option['values']]
+    return decoded
+
+
+# Variant fields whose values are dictionary-encoded
+_VARIANT_STRING_FIELDS = ('title', 'option1', 'option2', 'option3')
+
+
+def encode_products(products):
+    """Dictionary-encode products as written by Product.to_dict"""
+    strings = StringTable()
+    urls = UrlTable()
+
+    def string_id(value):
+        # Only strings are encoded; None and other values are kept as-is, wrapped to stay distinct
+        return strings.id_of(value) if isinstance(value, str) else [value]
+
+    encoded_products = []
+    for product in products:
+        encoded = dict(product)
+        for field in ('vendor', 'product_type'):
+            encoded[field] = string_id(product.get(field))
+        encoded['tags'] = [strings.id_of(tag) for tag in product.get('tags', ())]
+        encoded['options'] = [_encode_option(option, strings) for option in product.get('options', ())]
+        encoded['variants'] = [
+            {**variant, **{field: string_id(variant.get(field)) for field in _VARIANT_STRING_FIELDS}}
+            for variant in product.get('variants', ())
+        ]
+        encoded['images'] = [{**image, 'src': list(urls.split(image.get('src')))} for image in product.get('images', ())]
+
+        # The SEO block is derived from title and description
+        if encoded.get('seo') == {'title': product.get('title'), 'description': (product.get('description') or '')[:160]}:
+            del encoded['seo']
+        encoded_products.append(encoded)
+
+    return {
+        'format': ENCODING_FORMAT,
+        'strings': strings.strings,
+        'url_prefixes': urls.prefixes.strings,
+        'products': encoded_products
+    }
+
+
+def decode_products(encoded):
+    """Rebuild the products list from encode_products output"""
+    if encoded.get('format') != ENCODING_FORMAT:
+        raise ValueError(f"Unsupported catalog encoding: {encoded.get('format')!r}")
+
+    strings = encoded['strings']
+    urls = UrlTable(encoded['url_prefixes'])
+
+    def string_value(value):
+        return value[0] if isinstance(value, list) else strings[value]
+
+    products = []
+    for product in encoded['products']:
+        decoded = dict(product)
+        for field in ('vendor', 'product_type'):
+            decoded[field] = string_value(product[field])
+        decoded['tags'] = [strings[tag] for tag in product['tags']]
+        decoded['options'] = [_decode_option(option, strings) for option in product['options']]
+        decoded['variants'] = [
+            {**variant, **{field: string_value(variant[field]) for field in _VARIANT_STRING_FIELDS}}
+            for variant in product['variants']
+        ]
+        decoded['images'] = [{**image, 'src': urls.join(*image['src'])} for image in product['images']]
+        if 'seo' not in decoded:
+            decoded['seo'] = {'title': product.get('title'), 'description': (product.get('description') or '')[:160]}
+        products.append(decoded)
+
+    # Restore the original key order, which the encoded dicts share except for seo
+    return [_reorder(product) for product in products]
+
+
+# Product.to_dict key order up to seo; later keys (details) keep their relative order
+_PRODUCT_KEY_ORDER = (
+    'id', 'title', 'handle', 'description', 'vendor', 'product_type', 'created_at', 'updated_at',
+    'published_at', 'tags', 'available', 'price_range', 'variants', 'images', 'options', 'seo'
+)
+
+
+def _reorder(product):
+    ordered = {key: product[key] for key in _PRODUCT_KEY_ORDER if key in product}
+    ordered.update((key, value) for key, value in product.items() if key not in ordered)
+    return ordered
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(f"usage: {sys.argv[0]} ENCODED_JSON")
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        json.dump(decode_products(json.load(f)), sys.stdout, indent=2, ensure_ascii=False)
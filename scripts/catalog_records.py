@@ -0,0 +1,242 @@
+"""
+Compact record types for scraped catalog data (standard library only)
+
+Products, variants, images and collections are held as __slots__
+dataclasses while a scrape runs, instead of one dict per record. Lists
+become tuples, and derived fields such as the SEO block are computed
+when exported. Repeated strings are interned and image URLs are split
+into a shared prefix and a file name (see catalog_encoding). to_dict
+produces the JSON schema python_scraper has always written; from_dict
+reads it back for incremental and re-extraction runs.
+"""
+
+from dataclasses import dataclass
+from catalog_encoding import STRINGS, URLS, intern_options
+
+
+@dataclass(slots=True)
+class Variant:
+    id: object = None
+    title: str = None
+    # Kept as the API sent it (usually a string); to_dict converts to float
+    price: object = 0
+    compare_at_price: object = None
+    sku: str = None
+    inventory_quantity: int = None
+    available: bool = None
+    weight: object = None
+    option1: str = None
+    option2: str = None
+    option3: str = None
+
+    @classmethod
+    def from_api(cls, variant):
+        intern = STRINGS.intern
+        return cls(
+            variant.get('id'), intern(variant.get('title')), variant.get('price', 0),
+            variant.get('compare_at_price'), variant.get('sku'), variant.get('inventory_quantity'),
+            variant.get('available'), variant.get('weight'),
+            intern(variant.get('option1')), intern(variant.get('option2')), intern(variant.get('option3'))
+        )
+
+    from_dict = from_api
+
+    def price_value(self):
+        """Return the price as a float, or 0.0 if it isn't numeric"""
+        try:
+            return float(self.price)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'price': self.price_value(),
+            'compare_at_price': self.compare_at_price,
+            'sku': self.sku,
+            'inventory_quantity': self.inventory_quantity,
+            'available': self.available,
+            'weight': self.weight,
+            'option1': self.option1,
+            'option2': self.option2,
+            'option3': self.option3
+        }
+
+
+@dataclass(slots=True)
+class Image:
+    id: object = None
+    # src is stored as a URLS prefix id plus the rest of the URL
+    src_prefix: int = None
+    src_name: str = None
+    alt: str = ''
+    position: int = None
+    width: int = None
+    height: int = None
+    variant_ids: tuple = ()
+
+    @classmethod
+    def from_api(cls, image):
+        return cls(
+            image.get('id'), *URLS.split(image.get('src')), image.get('alt', ''), image.get('position'),
+            image.get('width'), image.get('height'), tuple(image.get('variant_ids', ()))
+        )
+
+    from_dict = from_api
+
+    @property
+    def src(self):
+        return URLS.join(self.src_prefix, self.src_name)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'src': self.src,
+            'alt': self.alt,
+            'position': self.position,
+            'width': self.width,
+            'height': self.height,
+            'variant_ids': list(self.variant_ids)
+        }
+
+
+# Product keys written by to_dict itself; anything else lives in Product.details
+_PRODUCT_KEYS = {
+    'id', 'title', 'handle', 'description', 'vendor', 'product_type', 'created_at', 'updated_at',
+    'published_at', 'tags', 'available', 'price_range', 'variants', 'images', 'options', 'seo'
+}
+
+
+@dataclass(slots=True)
+class Product:
+    id: object = None
+    title: str = None
+    handle: str = None
+    description: str = ''
+    vendor: str = None
+    product_type: str = None
+    created_at: str = None
+    updated_at: str = None
+    published_at: str = None
+    tags: tuple = ()
+    available: bool = None
+    options: tuple = ()
+    variants: tuple = ()
+    images: tuple = ()
+    min_price: float = None
+    max_price: float = None
+    # Fields added by later stages (details, reviews, structured data)
+    details: dict = None
+
+    @classmethod
+    def from_api(cls, product, description):
+        """Normalize a products.json record; description is the already-cleaned text"""
+        variants = tuple(Variant.from_api(variant) for variant in product.get('variants', ()))
+        prices = [price for price in (variant.price_value() for variant in variants) if price > 0]
+        intern = STRINGS.intern
+        return cls(
+            product.get('id'), product.get('title'), product.get('handle'), description,
+            intern(product.get('vendor')), intern(product.get('product_type')), product.get('created_at'),
+            product.get('updated_at'), product.get('published_at'), tuple(map(intern, product.get('tags', ()))),
+            product.get('available'), intern_options(product.get('options', ())), variants,
+            tuple(Image.from_api(image) for image in product.get('images', ())),
+            min(prices) if prices else None, max(prices) if prices else None
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a product from the JSON written by to_dict"""
+        price_range = data.get('price_range') or {}
+        details = {key: value for key, value in data.items() if key not in _PRODUCT_KEYS}
+        intern = STRINGS.intern
+        return cls(
+            data.get('id'), data.get('title'), data.get('handle'), data.get('description', ''),
+            intern(data.get('vendor')), intern(data.get('product_type')), data.get('created_at'),
+            data.get('updated_at'), data.get('published_at'), tuple(map(intern, data.get('tags', ()))),
+            data.get('available'), intern_options(data.get('options', ())),
+            tuple(Variant.from_dict(variant) for variant in data.get('variants', ())),
+            tuple(Image.from_dict(image) for image in data.get('images', ())),
+            price_range.get('min'), price_range.get('max'), details or None
+        )
+
+    def add_details(self, details):
+        """Attach fields gathered by later stages, overwriting earlier values"""
+        if self.details is None:
+            self.details = {}
+        self.details.update(details)
+
+    def to_dict(self):
+        data = {
+            'id': self.id,
+            'title': self.title,
+            'handle': self.handle,
+            'description': self.description,
+            'vendor': self.vendor,
+            'product_type': self.product_type,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'published_at': self.published_at,
+            'tags': list(self.tags),
+            'available': self.available,
+            'price_range': {
+                'min': self.min_price,
+                'max': self.max_price
+            },
+            'variants': [variant.to_dict() for variant in self.variants],
+            'images': [image.to_dict() for image in self.images],
+            'options': list(self.options),
+            'seo': {
+                'title': self.title,
+                'description': self.description[:160]
+            }
+        }
+        if self.details:
+            data.update(self.details)
+        return data
+
+
+@dataclass(slots=True)
+class Collection:
+    id: object = None
+    title: str = None
+    handle: str = None
+    description: str = ''
+    published_at: str = None
+    updated_at: str = None
+    sort_order: str = None
+    template_suffix: str = None
+    products_count: int = 0
+    image: dict = None
+
+    @classmethod
+    def from_api(cls, collection, description):
+        """Normalize a collections.json record; description is the already-cleaned text"""
+        return cls(
+            collection.get('id'), collection.get('title'), collection.get('handle'), description,
+            collection.get('published_at'), collection.get('updated_at'), collection.get('sort_order'),
+            collection.get('template_suffix'), collection.get('products_count', 0), collection.get('image')
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a collection from the JSON written by to_dict"""
+        return cls.from_api(data, data.get('description', ''))
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'title': self.title,
+            'handle': self.handle,
+            'description': self.description,
+            'published_at': self.published_at,
+            'updated_at': self.updated_at,
+            'sort_order': self.sort_order,
+            'template_suffix': self.template_suffix,
+            'products_count': self.products_count,
+            'image': self.image,
+            'seo': {
+                'title': self.title,
+                'description': self.description[:160]
+            }
+        }
@@ -0,0 +1,76 @@
+"""
+In-memory catalog store for scraped products and collections (standard library only)
+
+Records (see catalog_records) are kept in insertion order and indexed by
+id, handle and normalized title so ingest and lookups stay O(1) however
+large the catalog grows.
+"""
+
+import re
+
+
+def normalize_title(title):
+    """Casefold a title and collapse whitespace for index lookups"""
+    if not title:
+        return ''
+    return re.sub(r'\s+', ' ', title).strip().casefold()
+
+
+class CatalogStore:
+    """Insertion-ordered records indexed by id, handle and normalized title"""
+
+    def __init__(self, records=()):
+        self._by_id = {}
+        self._by_handle = {}
+        self._by_title = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        """Add a record unless its id is already stored; return True if added"""
+        record_id = record.id
+        if record_id in self._by_id:
+            return False
+
+        self._by_id[record_id] = record
+        self._index(record)
+        return True
+
+    def _index(self, record):
+        # First record wins, matching the old next(...) scan semantics
+        handle = record.handle
+        if handle:
+            self._by_handle.setdefault(handle, record)
+
+        title = normalize_title(record.title)
+        if title:
+            self._by_title.setdefault(title, record)
+
+    def get(self, record_id):
+        """Return the record with this id, or None"""
+        return self._by_id.get(record_id)
+
+    def by_handle(self, handle):
+        """Return the record with this handle, or None"""
+        return self._by_handle.get(handle)
+
+    def by_title(self, title):
+        """Return the record whose normalized title matches, or None"""
+        return self._by_title.get(normalize_title(title))
+
+    def handles(self):
+        """Return record handles in insertion order"""
+        return [record.handle for record in self._by_id.values() if record.handle]
+
+    def as_list(self):
+        """Return records converted to JSON-ready dicts"""
+        return [record.to_dict() for record in self._by_id.values()]
+
+    def __contains__(self, record_id):
+        return record_id in self._by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __len__(self):
+        return len(self._by_id)
@@ -6,15 +6,26 @@ Create comprehensive markdown content from scraped website data
 import json
 import os
 from datetime import datetime
-import urllib.request
-import urllib.parse
+import argparse
+from image_download import ImageDownloader, DownloadProgress, DEFAULT_WORKERS, DEFAULT_PER_HOST
+from image_manifest import ImageManifest, DEFAULT_MANIFEST_PATH
+from image_store import ContentStore, DEFAULT_STORE_DIR
+from json_output import write_json_if_changed
 
 class MarkdownContentGenerator:
-    def __init__(self):
+    def __init__(self, download_workers=DEFAULT_WORKERS, per_host_limit=DEFAULT_PER_HOST, image_manifest=DEFAULT_MANIFEST_PATH,
+                 image_store=DEFAULT_STORE_DIR):
         self.scraped_data = None
         self.product_data = None
         self.images_data = None
         self.markdown_content = {}
+        # Image downloads run concurrently, with at most per_host_limit requests per host
+        self.download_workers = download_workers
+        self.per_host_limit = per_host_limit
+        # Sync manifest of downloaded images; None re-downloads everything
+        self.image_manifest = image_manifest
+        # Content-addressed store that identical images are hard-linked to
+        self.image_store = image_store
         
     def load_scraped_data(self):
         """Load all scraped data files"""
@@ -48,7 +59,10 @@ class MarkdownContentGenerator:
         
         downloaded_images = []
         
-        for i, image in enumerate(self.images_data['images'][:50]):  # Limit to 50 images
+        # Build the download jobs first so they can run concurrently
+        pending = []
+        for i, image in enumerate(self.images_data['images']):
+            # A malformed entry skips just that image
             try:
                 img_url = image['src']
                 if not img_url or 'loading.gif' in img_url:
@@ -62,39 +76,48 @@ class MarkdownContentGenerator:
                 
                 # Determine directory
                 img_dir = 'products' if image.get('context') == 'product' else 'general'
-                local_path = f"public/images/{img_dir}/{filename}"
-                web_path = f"/images/{img_dir}/{filename}"
-                
-                # Download image
-                headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-                req = urllib.request.Request(img_url, headers=headers)
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    with open(local_path, 'wb') as f:
-                        f.write(response.read())
-                
-                downloaded_images.append({
-                    'original_url': img_url,
-                    'local_path': local_path,
-                    'web_path': web_path,
-                    'alt': image.get('alt', ''),
-                    'context': image.get('context', 'general'),
-                    'product_id': image.get('product_id'),
-                    'product_title': image.get('product_title')
-                })
-                
-                if len(downloaded_images) % 10 == 0:
-                    print(f"  ✅ Downloaded {len(downloaded_images)} images...")
+                pending.append((image, f"public/images/{img_dir}/{filename}", f"/images/{img_dir}/{filename}"))
                 
             except Exception as e:
-                print(f"  ⚠️ Error downloading {img_url}: {e}")
+                print(f"  ⚠️ Skipping image entry {i+1}: {e}")
                 continue
         
-        print(f"✅ Downloaded {len(downloaded_images)} images")
-        
-        # Save image mapping
-        with open('src/data/downloaded-images.json', 'w', encoding='utf-8') as f:
-            json.dump(downloaded_images, f, indent=2, ensure_ascii=False)
+        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        manifest = ImageManifest(self.image_manifest) if self.image_manifest else None
+        with ImageDownloader(headers=headers, max_workers=self.download_workers, max_per_host=self.per_host_limit,
+                             manifest=manifest) as downloader:
+            progress = DownloadProgress(len(pending))
+            results = downloader.download_all([(image['src'], local_path) for image, local_path, _ in pending], progress)
+        if manifest:
+            manifest.save()
+        
+        store = ContentStore(self.image_store)
+        for (image, local_path, web_path), result in zip(pending, results):
+            if not result.ok:
+                continue
+            # The downloader may have corrected the extension to the detected format
+            extension = os.path.splitext(result.path)[1]
+            local_path = os.path.splitext(local_path)[0] + extension
+            web_path = os.path.splitext(web_path)[0] + extension
+            store.add(local_path, result.sha256)
+            downloaded_images.append({
+                'original_url': image['src'],
+                'local_path': local_path,
+                'web_path': web_path,
+                'mime': result.mime,
+                'alt': image.get('alt', ''),
+                'context': image.get('context', 'general'),
+                'product_id': image.get('product_id'),
+                'product_title': image.get('product_title'),
+                'sha256': result.sha256
+            })
+        
+        print(f"✅ {progress.summary()}")
+        print(f"🗃️ Image store: {store.summary()}")
+        
+        # Save image mapping, leaving the file untouched when nothing changed
+        if not write_json_if_changed('src/data/downloaded-images.json', downloaded_images):
+            print("♻️ downloaded-images.json unchanged")
         
         return downloaded_images
     
@@ -492,5 +515,15 @@ class MarkdownContentGenerator:
             return False
 
 if __name__ == "__main__":
-    generator = MarkdownContentGenerator()
+    parser = argparse.ArgumentParser(description="Generate markdown content from scraped data")
+    parser.add_argument('--download-workers', type=int, default=DEFAULT_WORKERS, help="Concurrent image downloads")
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST, help="Maximum concurrent downloads per host")
+    parser.add_argument('--image-manifest', default=DEFAULT_MANIFEST_PATH, help="Image sync manifest path")
+    parser.add_argument('--full-image-sync', action='store_true', help="Re-download every image, ignoring the sync manifest")
+    parser.add_argument('--image-store', default=DEFAULT_STORE_DIR, help="Content-addressed image store directory")
+    args = parser.parse_args()
+    
+    generator = MarkdownContentGenerator(download_workers=args.download_workers, per_host_limit=args.per_host,
+                                         image_manifest=None if args.full_image_sync else args.image_manifest,
+                                         image_store=args.image_store)
     generator.run()
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Single-round-trip DOM extractors for Selenium pages
+
+Each extractor is one JavaScript function run through driver.execute_script
+that returns everything a stage needs from a page as a single JSON payload,
+instead of one WebDriver call per element and attribute. Selectors live here
+in Python and are passed in as arguments[0]. combine_extractors merges
+several named extractors into one script so a single visit can serve
+every stage that needs the same page. run_static_extractors produces the
+same payloads from archived HTML with BeautifulSoup, without a browser.
+"""
+
+import json
+from urllib.parse import urljoin
+
+HOMEPAGE_SELECTORS = {
+    'hero': '.hero, .banner, .slider, [class*="hero"], [class*="banner"]',
+    'hero_title': 'h1, h2, .title, [class*="title"]',
+    'hero_subtitle': 'p, .subtitle, [class*="subtitle"]',
+    'hero_cta': 'button, .btn, .cta, a[class*="btn"]',
+    'testimonial': '.testimonial, .review, [class*="testimonial"], [class*="review"]',
+    'testimonial_name': '.name, .author, [class*="name"], [class*="author"]',
+    'testimonial_text': '.text, .content, p',
+    'star': '.star, [class*="star"]'
+}
+
+REVIEW_SELECTORS = {
+    'review': '.review, [class*="review"]',
+    'author': '.author, .name, [class*="author"], [class*="name"]',
+    'star': '.star, [class*="star"]',
+    'text': '.text, .content, p',
+    'date': '.date, [class*="date"]'
+}
+
+PAGE_CONTENT_SELECTORS = {
+    'content': 'main, .content, .page-content, article',
+    'title': 'h1, .page-title'
+}
+
+# Shared helpers mirroring WebElement.text and get_attribute semantics
+_HELPERS = """
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : '';
+};
+const attr = (root, selector, name) => {
+    const el = root.querySelector(selector);
+    return el ? String(el[name] || el.getAttribute(name) || '') : '';
+};
+const jsonLd = () => Array.from(
+    document.querySelectorAll('script[type="application/ld+json"]'), script => script.innerHTML
+);
+"""
+
+HOMEPAGE_EXTRACTOR = _HELPERS + """
+const sel = arguments[0];
+const meta = {};
+for (const el of document.querySelectorAll('meta')) {
+    const key = el.getAttribute('name') || el.getAttribute('property');
+    if (key && !(key in meta)) {
+        meta[key] = el.getAttribute('content') || '';
+    }
+}
+const canonical = document.querySelector('link[rel="canonical"]');
+return {
+    title: document.title,
+    meta: meta,
+    canonical_url: canonical ? canonical.href : '',
+    heroes: Array.from(document.querySelectorAll(sel.hero), el => ({
+        title: text(el, sel.hero_title),
+        subtitle: text(el, sel.hero_subtitle),
+        cta_text: text(el, sel.hero_cta),
+        background_image: attr(el, 'img', 'src'),
+        html: el.outerHTML.slice(0, 500)
+    })),
+    testimonials: Array.from(document.querySelectorAll(sel.testimonial), el => ({
+        name: text(el, sel.testimonial_name),
+        text: text(el, sel.testimonial_text),
+        rating: el.querySelectorAll(sel.star).length,
+        image: attr(el, 'img', 'src')
+    })),
+    images: Array.from(document.images, img => ({
+        src: img.getAttribute('src') ? img.src : '',
+        data_src: img.getAttribute('data-src') || '',
+        alt: img.getAttribute('alt') || '',
+        width: img.getAttribute('width'),
+        height: img.getAttribute('height')
+    })),
+    json_ld: jsonLd()
+};
+"""
+
+REVIEWS_EXTRACTOR = _HELPERS + """
+const [sel, limit] = arguments;
+return Array.from(document.querySelectorAll(sel.review)).slice(0, limit).map(el => ({
+    author: text(el, sel.author),
+    rating: el.querySelectorAll(sel.star).length,
+    text: text(el, sel.text),
+    date: text(el, sel.date)
+}));
+"""
+
+PAGE_CONTENT_EXTRACTOR = _HELPERS + """
+const sel = arguments[0];
+return {
+    title: text(document, sel.title),
+    content: text(document, sel.content)
+};
+"""
+
+JSON_LD_EXTRACTOR = _HELPERS + """
+return jsonLd();
+"""
+
+# Extractor name -> (script, execute_script arguments)
+EXTRACTORS = {
+    'homepage': (HOMEPAGE_EXTRACTOR, [HOMEPAGE_SELECTORS]),
+    'reviews': (REVIEWS_EXTRACTOR, [REVIEW_SELECTORS, 5]),
+    'page_content': (PAGE_CONTENT_EXTRACTOR, [PAGE_CONTENT_SELECTORS]),
+    'json_ld': (JSON_LD_EXTRACTOR, [])
+}
+
+
+def combine_extractors(names):
+    """Build one script returning {name: payload} for each named extractor
+
+    Returns (script, args) to pass to driver.execute_script(script, args).
+    """
+    names = sorted(names)
+    calls = [
+        f"{json.dumps(name)}: (function () {{{EXTRACTORS[name][0]}}}).apply(null, args[{json.dumps(name)}])"
+        for name in names
+    ]
+    script = "const args = arguments[0];\nreturn {\n" + ",\n".join(calls) + "\n};"
+    return script, {name: EXTRACTORS[name][1] for name in names}
+
+
+# Static mirrors of the JavaScript extractors, for re-extraction from archived HTML
+
+def _text(root, selector):
+    element = root.select_one(selector)
+    return element.get_text(' ', strip=True) if element else ''
+
+
+def _src(root, selector, page_url):
+    element = root.select_one(selector)
+    return urljoin(page_url, element['src']) if element and element.get('src') else ''
+
+
+def _static_json_ld(soup, page_url):
+    return [script.string or script.get_text() for script in soup.select('script[type="application/ld+json"]')]
+
+
+def _static_homepage(soup, page_url, sel):
+    meta = {}
+    for element in soup.find_all('meta'):
+        key = element.get('name') or element.get('property')
+        if key and key not in meta:
+            meta[key] = element.get('content') or ''
+    canonical = soup.select_one('link[rel="canonical"]')
+
+    return {
+        'title': soup.title.get_text(strip=True) if soup.title else '',
+        'meta': meta,
+        'canonical_url': urljoin(page_url, canonical['href']) if canonical and canonical.get('href') else '',
+        'heroes': [{
+            'title': _text(element, sel['hero_title']),
+            'subtitle': _text(element, sel['hero_subtitle']),
+            'cta_text': _text(element, sel['hero_cta']),
+            'background_image': _src(element, 'img', page_url),
+            'html': str(element)[:500]
+        } for element in soup.select(sel['hero'])],
+        'testimonials': [{
+            'name': _text(element, sel['testimonial_name']),
+            'text': _text(element, sel['testimonial_text']),
+            'rating': len(element.select(sel['star'])),
+            'image': _src(element, 'img', page_url)
+        } for element in soup.select(sel['testimonial'])],
+        'images': [{
+            'src': urljoin(page_url, img['src']) if img.get('src') else '',
+            'data_src': img.get('data-src') or '',
+            'alt': img.get('alt') or '',
+            'width': img.get('width'),
+            'height': img.get('height')
+        } for img in soup.find_all('img')],
+        'json_ld': _static_json_ld(soup, page_url)
+    }
+
+
+def _static_reviews(soup, page_url, sel, limit):
+    return [{
+        'author': _text(element, sel['author']),
+        'rating': len(element.select(sel['star'])),
+        'text': _text(element, sel['text']),
+        'date': _text(element, sel['date'])
+    } for element in soup.select(sel['review'])[:limit]]
+
+
+def _static_page_content(soup, page_url, sel):
+    return {
+        'title': _text(soup, sel['title']),
+        'content': _text(soup, sel['content'])
+    }
+
+
+STATIC_EXTRACTORS = {
+    'homepage': _static_homepage,
+    'reviews': _static_reviews,
+    'page_content': _static_page_content,
+    'json_ld': _static_json_ld
+}
+
+
+def run_static_extractors(html, names, page_url):
+    """Run named extractors over static HTML, returning the same payloads as the browser"""
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    # lxml is several times faster when installed; html.parser always works
+    try:
+        soup = BeautifulSoup(html, 'lxml')
+    except FeatureNotFound:
+        soup = BeautifulSoup(html, 'html.parser')
+
+    return {name: STATIC_EXTRACTORS[name](soup, page_url, *EXTRACTORS[name][1]) for name in names}
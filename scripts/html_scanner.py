@@ -0,0 +1,118 @@
+"""
+Single-pass HTML scanner for the homepage (standard library only)
+
+scan_html walks the document once, left to right, and collects the title,
+every meta tag, every img/source with src, data-src or srcset, and the
+JSON-LD script blocks, whatever order their attributes are in.
+
+Tokens are matched by one regex whose alternatives each start with a
+different character and never need to give characters back. As in
+browsers, a quote opens a quoted value only right after '=', and such a
+value runs to the closing quote or the end of the document; unquoted
+values run to whitespace or '>', apostrophes and all. A tag runs to its
+'>' or the end of the document. The scan position only
+moves forward, so running time is linear in the page size however
+malformed the markup is.
+"""
+
+import html
+import re
+
+# Comment, end tag / declaration, or start tag with its raw attribute text
+_TOKEN = re.compile(r'''
+    <(?:
+        !--.*?(?:-->|\Z)
+      | [!?/][^>]*>?
+      | ([a-zA-Z][^\s/>]*)((?:[^>=]+|=\s*(?:"[^"]*"?|'[^']*'?|[^\s>]*))*)>?
+    )
+''', re.DOTALL | re.VERBOSE)
+
+_ATTRIBUTE = re.compile(r'''([^\s/>="'][^\s/>=]*)(?:\s*=\s*(?:"([^"]*)"?|'([^']*)'?|([^\s>]*)))?''')
+
+# Elements whose content is text up to the matching close tag, not markup.
+# noscript is scanned as markup: lazy-loading themes put the real <img> there.
+_RAW_TEXT_CLOSE = {
+    tag: re.compile(f'</{tag}', re.IGNORECASE)
+    for tag in ('script', 'style', 'title', 'textarea')
+}
+
+IMAGE_TAGS = {'img', 'source'}
+
+_COLLECTED_TAGS = IMAGE_TAGS | {'meta'} | set(_RAW_TEXT_CLOSE)
+
+
+class HomepageScan:
+    """Everything scan_html collects from a page"""
+
+    def __init__(self):
+        self.title = ''
+        self.meta = []
+        self.images = []
+        self.json_ld = []
+
+    def meta_content(self, key):
+        """Return the content of the first meta tag whose name or property is key"""
+        key = key.lower()
+        for attrs in self.meta:
+            if (attrs.get('name') or attrs.get('property') or '').lower() == key:
+                return attrs.get('content', '')
+        return ''
+
+
+def parse_attributes(text):
+    """Parse a start tag's attribute text into a dict; the first occurrence of a name wins"""
+    attrs = {}
+    for match in _ATTRIBUTE.finditer(text):
+        name = match.group(1).lower()
+        if name in attrs:
+            continue
+        double, single, bare = match.group(2, 3, 4)
+        value = double if double is not None else single if single is not None else bare or ''
+        attrs[name] = html.unescape(value) if '&' in value else value
+    return attrs
+
+
+def scan_html(page):
+    """Scan a page once and return a HomepageScan"""
+    result = HomepageScan()
+    search = _TOKEN.search
+    pos = 0
+
+    while True:
+        token = search(page, pos)
+        if token is None:
+            return result
+        pos = token.end()
+
+        tag = token.group(1)
+        if tag is None:
+            continue
+        tag = tag.lower()
+        if tag not in _COLLECTED_TAGS:
+            continue
+
+        attrs = parse_attributes(token.group(2))
+        if tag == 'meta':
+            result.meta.append(attrs)
+        elif tag in IMAGE_TAGS:
+            if attrs.get('src') or attrs.get('data-src') or attrs.get('srcset'):
+                result.images.append({
+                    'tag': tag,
+                    'src': attrs.get('src', ''),
+                    'data_src': attrs.get('data-src', ''),
+                    'srcset': attrs.get('srcset', ''),
+                    'alt': attrs.get('alt', '')
+                })
+        else:
+            close = _RAW_TEXT_CLOSE[tag].search(page, pos)
+            content_end = close.start() if close else len(page)
+            if tag == 'title' and not result.title:
+                result.title = html.unescape(page[pos:content_end].strip())
+            elif tag == 'script' and attrs.get('type', '').lower() == 'application/ld+json':
+                result.json_ld.append(page[pos:content_end])
+            pos = content_end
+
+
+def srcset_urls(srcset):
+    """Return the candidate URLs of a srcset attribute, in the order written"""
+    return [candidate.split()[0] for candidate in srcset.split(',') if candidate.strip()]
@@ -0,0 +1,102 @@
+"""
+Fast HTML-to-text conversion for product and collection descriptions
+
+html_to_text streams markup through a reusable html.parser.HTMLParser
+subclass that only collects text, instead of building a BeautifulSoup
+tree. Output matches BeautifulSoup(text, 'html.parser').get_text().strip():
+entities are decoded and script, style and comment content is dropped.
+Results are memoized by content hash in a bounded LRU, since the same
+descriptions recur across products, SEO fields and repeated runs.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+
+# Elements whose content BeautifulSoup's get_text() leaves out
+_SKIPPED_ELEMENTS = {'script', 'style', 'template'}
+
+
+class TextExtractor(HTMLParser):
+    """Streaming parser that keeps text nodes and discards everything else"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+
+    def reset(self):
+        super().reset()
+        self.parts = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_ELEMENTS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_ELEMENTS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+    def unknown_decl(self, data):
+        # <![CDATA[...]]> sections count as text, as in BeautifulSoup
+        if data.startswith('CDATA[') and not self.skip_depth:
+            self.parts.append(data[6:])
+
+    def text(self, markup):
+        """Return the text content of a markup fragment, reusing this parser"""
+        self.reset()
+        self.feed(markup)
+        self.close()
+        return ''.join(self.parts)
+
+
+class TextCache:
+    """Bounded LRU of html -> text, keyed by a digest of the markup"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # One parser per thread; HTMLParser instances are not thread-safe
+        self._local = threading.local()
+
+    def html_to_text(self, markup):
+        """Return stripped text content of an HTML fragment"""
+        if not markup:
+            return ""
+
+        key = hashlib.blake2b(markup.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            text = self.entries.get(key)
+            if text is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return text
+            self.misses += 1
+
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = TextExtractor()
+        text = parser.text(markup).strip()
+
+        with self._lock:
+            self.entries[key] = text
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return text
+
+
+_default_cache = TextCache()
+
+
+def html_to_text(markup):
+    """Return stripped text content of an HTML fragment using the shared cache"""
+    return _default_cache.html_to_text(markup)
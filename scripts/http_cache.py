@@ -0,0 +1,217 @@
+"""
+On-disk HTTP response cache with ETag/Last-Modified revalidation (standard library only)
+
+Bodies are stored one file per URL alongside a JSON index of validators.
+Callers send the validators back as If-None-Match/If-Modified-Since and
+serve the stored body when the server answers 304 Not Modified. The cache
+is capped in size with least-recently-used eviction, and an optional TTL
+lets recent entries be served without contacting the server at all.
+The *_chunks variants read and write bodies incrementally for callers that
+stream large responses.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseCache:
+    """URL-keyed body cache with conditional-request validators and LRU eviction"""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, ttl=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.index_path = os.path.join(directory, 'index.json')
+        self.stats = {'fresh': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._entries = {}
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def fresh_body(self, url):
+        """Return the cached body if it is younger than the TTL, else None"""
+        if not self._is_fresh(url):
+            return None
+        body = self._read_body(url)
+        if body is not None:
+            self.stats['fresh'] += 1
+        return body
+
+    def fresh_chunks(self, url, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Like fresh_body, but return an iterator over the body's chunks"""
+        if not self._is_fresh(url):
+            return None
+        chunks = self._open_chunks(url, chunk_size)
+        if chunks is not None:
+            self.stats['fresh'] += 1
+        return chunks
+
+    def conditional_headers(self, url):
+        """Return If-None-Match/If-Modified-Since headers for a cached URL"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry or not os.path.exists(self._body_path(url)):
+                return {}
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def revalidated(self, url, headers=None):
+        """Return the stored body after a 304, refreshing its validators"""
+        body = self._read_body(url)
+        if body is None:
+            return None
+        self._refresh(url, headers)
+        return body
+
+    def revalidated_chunks(self, url, headers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Like revalidated, but return an iterator over the body's chunks"""
+        chunks = self._open_chunks(url, chunk_size)
+        if chunks is None:
+            return None
+        self._refresh(url, headers)
+        return chunks
+
+    def store(self, url, body, headers):
+        """Store a 200 response body with its validators, evicting old entries"""
+        if len(body) > self.max_bytes:
+            return
+
+        path = self._body_path(url)
+        temp_path = f"{path}.tmp.{threading.get_ident()}"
+        with open(temp_path, 'wb') as f:
+            f.write(body)
+        os.replace(temp_path, path)
+        self._commit(url, len(body), headers)
+
+    def store_chunks(self, url, chunks, headers):
+        """Yield a 200 response's chunks while writing them to the cache
+
+        The entry is committed only once the stream has been read to the end,
+        so an interrupted or oversized body never replaces a good one.
+        """
+        path = self._body_path(url)
+        temp_path = f"{path}.tmp.{threading.get_ident()}"
+        size = 0
+        complete = False
+        try:
+            with open(temp_path, 'wb') as f:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if size <= self.max_bytes:
+                        f.write(chunk)
+                    yield chunk
+            complete = size <= self.max_bytes
+        finally:
+            if complete:
+                os.replace(temp_path, path)
+                self._commit(url, size, headers)
+            else:
+                os.remove(temp_path)
+
+    def save(self):
+        """Persist the index so validators survive to the next run"""
+        with self._lock:
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(temp_path, self.index_path)
+
+    def _is_fresh(self, url):
+        if self.ttl is None:
+            return False
+        with self._lock:
+            entry = self._entries.get(url)
+            return bool(entry) and time.time() - entry['stored_at'] <= self.ttl
+
+    def _refresh(self, url, headers):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                entry['stored_at'] = time.time()
+                if headers is not None:
+                    entry['etag'] = headers.get('ETag') or entry.get('etag')
+                    entry['last_modified'] = headers.get('Last-Modified') or entry.get('last_modified')
+        self.stats['revalidated'] += 1
+
+    def _commit(self, url, size, headers):
+        now = time.time()
+        with self._lock:
+            self._entries[url] = {
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'size': size,
+                'stored_at': now,
+                'last_access': now
+            }
+            self._evict()
+        self.stats['stored'] += 1
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _body_path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+    def _read_body(self, url):
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                body = f.read()
+        except OSError:
+            with self._lock:
+                self._entries.pop(url, None)
+            return None
+        with self._lock:
+            if url in self._entries:
+                self._entries[url]['last_access'] = time.time()
+        return body
+
+    def _open_chunks(self, url, chunk_size):
+        try:
+            f = open(self._body_path(url), 'rb')
+        except OSError:
+            with self._lock:
+                self._entries.pop(url, None)
+            return None
+        with self._lock:
+            if url in self._entries:
+                self._entries[url]['last_access'] = time.time()
+        return self._iter_file(f, chunk_size)
+
+    def _iter_file(self, f, chunk_size):
+        with f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def _evict(self):
+        # Caller holds the lock
+        total = sum(entry['size'] for entry in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(self._entries.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+            del self._entries[url]
+            total -= entry['size']
+            self.stats['evicted'] += 1
@@ -0,0 +1,205 @@
+"""
+Keep-alive HTTP connection pool built on http.client (standard library only)
+
+Connections are reused per (scheme, host, port) so repeated requests to the
+same storefront skip the TCP and TLS handshakes. Response bodies are read in
+chunks and gzip/deflate content encodings are decoded incrementally.
+"""
+
+import codecs
+import http.client
+import threading
+import zlib
+from urllib.parse import urlsplit, urljoin
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _DeflateDecoder:
+    """Decode 'deflate' bodies, which servers send either zlib-wrapped or raw"""
+
+    def __init__(self):
+        self._decoder = zlib.decompressobj(zlib.MAX_WBITS)
+        self._started = False
+
+    def decompress(self, data):
+        if not self._started:
+            self._started = True
+            try:
+                return self._decoder.decompress(data)
+            except zlib.error:
+                self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decoder.decompress(data)
+
+    def flush(self):
+        return self._decoder.flush()
+
+
+def make_decompressor(content_encoding):
+    """Return an incremental decoder for a Content-Encoding value, or None"""
+    encoding = (content_encoding or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        return _DeflateDecoder()
+    return None
+
+
+class PooledResponse:
+    """A response whose connection returns to the pool once the body is consumed"""
+
+    def __init__(self, pool, key, conn, raw, url, slot):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._raw = raw
+        self._slot = slot
+        self._finished = False
+        self._released = False
+        self.url = url
+        self.status = raw.status
+        self.reason = raw.reason
+        self.headers = raw.headers
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield the decoded body in chunks without buffering all of it"""
+        decoder = make_decompressor(self.headers.get('Content-Encoding'))
+        try:
+            while True:
+                chunk = self._raw.read(chunk_size)
+                if not chunk:
+                    break
+                if decoder:
+                    chunk = decoder.decompress(chunk)
+                if chunk:
+                    yield chunk
+            if decoder:
+                tail = decoder.flush()
+                if tail:
+                    yield tail
+            self._finished = True
+        finally:
+            self.close()
+
+    def read(self):
+        """Return the whole decoded body as bytes"""
+        return b''.join(self.iter_chunks())
+
+    def text(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Return the decoded body as str, decoding chunk by chunk"""
+        charset = self.headers.get_content_charset() or 'utf-8'
+        decoder = codecs.getincrementaldecoder(charset)()
+        parts = [decoder.decode(chunk) for chunk in self.iter_chunks(chunk_size)]
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+
+    def close(self):
+        """Release the connection, keeping it alive only if the body was fully read"""
+        if self._released:
+            return
+        self._released = True
+        if self._finished and not self._raw.will_close:
+            self._pool._checkin(self._key, self._conn)
+        else:
+            self._conn.close()
+        self._slot.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ConnectionPool:
+    """Per-host pool of persistent HTTP/HTTPS connections"""
+
+    def __init__(self, headers=None, timeout=10, max_per_host=4, max_redirects=5):
+        self.headers = {'Accept-Encoding': 'gzip, deflate', **(headers or {})}
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.max_redirects = max_redirects
+        self._idle = {}
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def request(self, url, method='GET', headers=None):
+        """Send a request, following redirects, and return a PooledResponse"""
+        for _ in range(self.max_redirects + 1):
+            response = self._send(method, url, headers)
+            location = response.headers.get('Location')
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+
+            # Redirect bodies are tiny; drain so the connection can be reused
+            response.read()
+            url = urljoin(url, location)
+            if response.status == 303:
+                method = 'GET'
+
+        raise http.client.HTTPException(f"Too many redirects fetching {url}")
+
+    def close(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _send(self, method, url, headers):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        request_headers = {**self.headers, **(headers or {})}
+
+        slot = self._slot(key)
+        slot.acquire()
+        conn = None
+        try:
+            conn = self._checkout(key)
+            reused = conn is not None
+            if not reused:
+                conn = self._connect(key)
+            try:
+                conn.request(method, path, headers=request_headers)
+                raw = conn.getresponse()
+            except ConnectionError:
+                # The server may have dropped an idle keep-alive connection
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._connect(key)
+                conn.request(method, path, headers=request_headers)
+                raw = conn.getresponse()
+        except BaseException:
+            if conn is not None:
+                conn.close()
+            slot.release()
+            raise
+
+        return PooledResponse(self, key, conn, raw, url, slot)
+
+    def _connect(self, key):
+        scheme, host, port = key
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        if scheme == 'http':
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+        raise ValueError(f"Unsupported URL scheme: {scheme}")
+
+    def _slot(self, key):
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self._slots[key]
+
+    def _checkout(self, key):
+        with self._lock:
+            connections = self._idle.get(key)
+            return connections.pop() if connections else None
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
@@ -0,0 +1,302 @@
+"""
+Concurrent image downloads over keep-alive connections (standard library only)
+
+ImageDownloader fetches a batch of (url, path) jobs on a thread pool. Jobs
+are queued per host and each host is drained by at most max_per_host
+workers, so one slow host never ties up every thread and no host sees more
+than that many requests at once. Connections come from an
+http_pool.ConnectionPool and are reused from one image to the next.
+DownloadProgress keeps completed/failed/byte counts and reports as
+downloads finish.
+
+Bodies are streamed in chunks to `<path>.part` and renamed into place only
+once the byte count matches Content-Length, so a failed download never
+leaves a truncated image behind. The partial file is kept with the
+response's validator beside it; the next attempt, in this run or a later
+one, asks for the rest with Range/If-Range instead of starting over.
+
+With an image_manifest.ImageManifest attached, a file that is already on
+disk and matches the manifest is revalidated with a conditional request,
+and a 304 skips the download.
+
+The first bytes of each body are sniffed as they stream past and the
+file's extension is corrected to the real format (see image_format), so a
+job's path only supplies the name; DownloadResult.path is where the image
+actually landed.
+"""
+
+import hashlib
+import http.client
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+from http_pool import ConnectionPool
+from image_format import SNIFF_BYTES, sniff_image, sniff_file
+
+DEFAULT_WORKERS = 16
+DEFAULT_PER_HOST = 8
+DEFAULT_RETRIES = 2
+CHUNK_SIZE = 64 * 1024
+PARTIAL_SUFFIX = '.part'
+VALIDATOR_SUFFIX = '.validator'
+
+
+class DownloadError(Exception):
+    """The server did not return the image"""
+
+
+class IncompleteDownload(DownloadError):
+    """The body ended early or could not be resumed; retrying picks up from the partial file"""
+
+
+@dataclass(slots=True)
+class DownloadResult:
+    url: str
+    path: str
+    size: int = 0
+    # Bytes already on disk from an earlier, interrupted attempt
+    resumed_from: int = 0
+    sha256: str = None
+    mime: str = None
+    # True when the server answered 304 and the existing file was kept
+    unchanged: bool = False
+    error: Exception = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class DownloadProgress:
+    """Thread-safe counters for a batch, printed every `report_every` downloads"""
+
+    def __init__(self, total, report_every=10):
+        self.total = total
+        self.report_every = report_every
+        self.completed = 0
+        self.failed = 0
+        self.bytes = 0
+        self.resumed = 0
+        self.unchanged = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, result):
+        with self._lock:
+            if result.ok:
+                self.completed += 1
+                self.unchanged += result.unchanged
+                if not result.unchanged:
+                    self.bytes += result.size - result.resumed_from
+                    self.resumed += bool(result.resumed_from)
+                report = self.completed % self.report_every == 0
+            else:
+                self.failed += 1
+                report = False
+            line = self._line() if report else None
+
+        if not result.ok:
+            print(f"  ⚠️ Error downloading {result.url}: {result.error}")
+        elif line:
+            print(f"  ✅ {line}")
+
+    def summary(self):
+        with self._lock:
+            return self._line()
+
+    def _line(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        resumed = f", {self.resumed} resumed" if self.resumed else ''
+        return (f"Synced {self.completed}/{self.total} images ({self.unchanged} unchanged), {self.failed} failed{resumed} "
+                f"({self.bytes / 1e6:.1f} MB in {elapsed:.1f}s, {self.bytes / 1e6 / elapsed:.1f} MB/s)")
+
+
+class ImageDownloader:
+    """Download images concurrently with a per-host limit on parallel requests"""
+
+    def __init__(self, headers=None, max_workers=DEFAULT_WORKERS, max_per_host=DEFAULT_PER_HOST, timeout=10,
+                 retries=DEFAULT_RETRIES, manifest=None):
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.retries = retries
+        # Optional ImageManifest; when set, valid files are revalidated instead of downloaded
+        self.manifest = manifest
+        self.http = ConnectionPool(headers=headers, timeout=timeout, max_per_host=max_per_host)
+
+    def download(self, url, path):
+        """Stream one image to `path` and return its DownloadResult
+
+        The extension of `path` is replaced when the bytes show another
+        format. Dropped connections and short bodies are retried, resuming
+        from the bytes already written; HTTP errors are not.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                return self._fetch(url, path)
+            except (OSError, http.client.HTTPException, IncompleteDownload):
+                if attempt == self.retries:
+                    raise
+
+    def download_all(self, jobs, progress=None):
+        """Download (url, path) jobs; return DownloadResults in job order"""
+        jobs = list(jobs)
+        progress = progress or DownloadProgress(len(jobs))
+        results = [None] * len(jobs)
+
+        queues = {}
+        for index, (url, path) in enumerate(jobs):
+            host = urlsplit(url).netloc.lower()
+            queues.setdefault(host, deque()).append((index, url, path))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for queue in queues.values():
+                for _ in range(min(self.max_per_host, len(queue))):
+                    executor.submit(self._drain, queue, results, progress)
+
+        return results
+
+    def close(self):
+        self.http.close()
+
+    def _fetch(self, url, path):
+        partial_path = path + PARTIAL_SUFFIX
+        validator_path = partial_path + VALIDATOR_SUFFIX
+        offset, validator = self._partial_state(partial_path, validator_path)
+
+        # Ranges are byte offsets into the unencoded file, so never ask for gzip
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+            headers['If-Range'] = validator
+        conditional = self.manifest.conditional_headers(url, path) if self.manifest and not offset else {}
+        headers.update(conditional)
+
+        with self.http.request(url, headers=headers) as response:
+            if response.status == 304 and conditional:
+                response.read()
+                entry = self.manifest.refresh(url, response.headers)
+                mime, extension = sniff_file(entry['path'])
+                final_path = self._typed_path(entry['path'], extension)
+                if final_path != entry['path']:
+                    # Written under the wrong extension by an earlier run
+                    os.replace(entry['path'], final_path)
+                    self.manifest.rename(url, final_path, mime)
+                return DownloadResult(url, final_path, entry['size'], sha256=entry['sha256'],
+                                      mime=mime or entry.get('mime'), unchanged=True)
+            if response.status == 206 and offset and _range_start(response.headers.get('Content-Range')) == offset:
+                mode = 'r+b'
+            elif response.status == 200:
+                # A full body: no partial, or the image changed since it was written
+                offset, mode = 0, 'wb'
+                self._write_validator(validator_path, response.headers)
+            else:
+                response.read()
+                if response.status in (206, 416):
+                    self._discard_partial(partial_path, validator_path)
+                    raise IncompleteDownload(f"Could not resume at byte {offset}: HTTP {response.status}")
+                raise DownloadError(f"HTTP {response.status} {response.reason}")
+
+            length = response.headers.get('Content-Length')
+            expected = offset + int(length) if length is not None and not response.headers.get('Content-Encoding') else None
+            digest = hashlib.sha256()
+            head = b''
+            with open(partial_path, mode) as f:
+                if mode == 'r+b':
+                    # Hash the bytes from the earlier attempt, leaving the file positioned at its end
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                        digest.update(chunk)
+                        if len(head) < SNIFF_BYTES:
+                            head += chunk[:SNIFF_BYTES - len(head)]
+                for chunk in response.iter_chunks(CHUNK_SIZE):
+                    digest.update(chunk)
+                    if len(head) < SNIFF_BYTES:
+                        head += chunk[:SNIFF_BYTES - len(head)]
+                    f.write(chunk)
+                size = f.tell()
+            response_headers = response.headers
+
+        if expected is not None and size != expected:
+            raise IncompleteDownload(f"Got {size} of {expected} bytes")
+
+        mime, extension = sniff_image(head)
+        if mime is None:
+            # Unrecognized bytes: trust the server's image/* type, if any, and keep the name
+            content_type = (response_headers.get_content_type() or '').lower()
+            mime = content_type if content_type.startswith('image/') else None
+        final_path = self._typed_path(path, extension)
+        os.replace(partial_path, final_path)
+        if final_path != path and os.path.exists(path):
+            # Left over from a run that named it by the default extension
+            os.remove(path)
+        if os.path.exists(validator_path):
+            os.remove(validator_path)
+        sha256 = digest.hexdigest()
+        if self.manifest:
+            self.manifest.record(url, final_path, response_headers, size, sha256, mime)
+        return DownloadResult(url, final_path, size, offset, sha256, mime)
+
+    def _typed_path(self, path, extension):
+        """Return `path` with its extension replaced by a sniffed one"""
+        if not extension:
+            return path
+        stem, current = os.path.splitext(path)
+        if current.lower() == extension or (extension == '.jpg' and current.lower() == '.jpeg'):
+            return path
+        return stem + extension
+
+    def _partial_state(self, partial_path, validator_path):
+        """Return (bytes on disk, If-Range validator) for a resumable partial, else (0, None)"""
+        try:
+            offset = os.path.getsize(partial_path)
+            with open(validator_path, 'r', encoding='utf-8') as f:
+                validator = f.read().strip()
+        except OSError:
+            return 0, None
+        return (offset, validator) if offset and validator else (0, None)
+
+    def _write_validator(self, validator_path, headers):
+        # If-Range only accepts a strong ETag or a Last-Modified date
+        etag = headers.get('ETag')
+        validator = etag if etag and not etag.startswith('W/') else headers.get('Last-Modified')
+        if validator:
+            with open(validator_path, 'w', encoding='utf-8') as f:
+                f.write(validator)
+        elif os.path.exists(validator_path):
+            os.remove(validator_path)
+
+    def _discard_partial(self, partial_path, validator_path):
+        for stale in (partial_path, validator_path):
+            if os.path.exists(stale):
+                os.remove(stale)
+
+    def _drain(self, queue, results, progress):
+        while True:
+            try:
+                index, url, path = queue.popleft()
+            except IndexError:
+                return
+            try:
+                result = self.download(url, path)
+            except Exception as e:
+                result = DownloadResult(url, path, error=e)
+            results[index] = result
+            progress.record(result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _range_start(content_range):
+    """Return the first byte offset of a 'bytes start-end/total' Content-Range, or None"""
+    try:
+        unit, _, spec = content_range.partition(' ')
+        return int(spec.split('-', 1)[0]) if unit == 'bytes' else None
+    except (AttributeError, ValueError):
+        return None
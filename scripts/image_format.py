@@ -0,0 +1,47 @@
+"""
+Image format detection from magic bytes (standard library only)
+
+Servers and URLs are unreliable about image types: Shopify serves PNG
+logos and WebP renditions under names that don't say so. sniff_image
+looks only at the first SNIFF_BYTES bytes of a body and recognizes JPEG,
+PNG, GIF, WebP and AVIF, returning the MIME type and file extension to
+use.
+"""
+
+SNIFF_BYTES = 32
+
+JPEG = ('image/jpeg', '.jpg')
+PNG = ('image/png', '.png')
+GIF = ('image/gif', '.gif')
+WEBP = ('image/webp', '.webp')
+AVIF = ('image/avif', '.avif')
+
+_AVIF_BRANDS = {b'avif', b'avis'}
+
+
+def sniff_image(head):
+    """Return (mime, extension) for the leading bytes of an image, or (None, None)"""
+    if head.startswith(b'\xff\xd8\xff'):
+        return JPEG
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return PNG
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return GIF
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return WEBP
+    if head[4:8] == b'ftyp' and _is_avif(head):
+        return AVIF
+    return None, None
+
+
+def sniff_file(path):
+    """Like sniff_image, reading just the start of a file"""
+    with open(path, 'rb') as f:
+        return sniff_image(f.read(SNIFF_BYTES))
+
+
+def _is_avif(head):
+    # ISO-BMFF ftyp box: size, 'ftyp', major brand, minor version, compatible brands
+    box_end = min(int.from_bytes(head[:4], 'big'), len(head))
+    brands = [head[8:12]] + [head[offset:offset + 4] for offset in range(16, box_end - 3, 4)]
+    return any(brand in _AVIF_BRANDS for brand in brands)
@@ -0,0 +1,123 @@
+"""
+URL-normalizing image index with on-ingest deduplication (standard library only)
+
+The same picture reaches the scrapers under many URLs: with and without
+Shopify's ?v= cache-buster, as _800x/_grande/@2x size variants, and as
+protocol-relative or http/https links. canonical_image_url reduces those
+to one key, and ImageIndex keeps a single entry per key from the moment it
+is added, recording where else the image was seen as back-references
+instead of storing another copy. When several renditions collapse to one
+key, the entry keeps the URL of the largest: the unsuffixed original if
+it was seen, else the biggest size suffix.
+"""
+
+import re
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# Shopify CDN size/crop/density suffix before the file extension, e.g. _800x, _x600, _800x800_crop_center@2x
+_SIZE_SUFFIX = re.compile(
+    r'_(?P<size>\d+x\d*|x\d+|pico|icon|thumb|small|compact|medium|large|grande|original|master)'
+    r'(?:_crop_[a-z]+)?(?:@(?P<density>\d)x)?(?=\.[A-Za-z0-9]+$)'
+)
+
+# Longest side in pixels of Shopify's named sizes; original/master are the full image
+_NAMED_SIZES = {
+    'pico': 16, 'icon': 32, 'thumb': 50, 'small': 100, 'compact': 160,
+    'medium': 240, 'large': 480, 'grande': 600, 'original': float('inf'), 'master': float('inf')
+}
+
+# Query parameters that only bust caches or pick a rendition
+_VARIANT_PARAMS = {'v', 'width', 'height', 'crop'}
+
+
+def canonical_image_url(url):
+    """Return the dedup key for an image URL: no scheme, size suffix or cache-buster"""
+    if url.startswith('//'):
+        url = 'https:' + url
+    parts = urlsplit(url)
+    path = _SIZE_SUFFIX.sub('', parts.path)
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query) if key not in _VARIANT_PARAMS])
+    return parts.netloc.lower() + path + (f"?{query}" if query else '')
+
+
+def rendition_size(url):
+    """Return the longest side a Shopify size suffix asks for; unsuffixed URLs are the full image"""
+    match = _SIZE_SUFFIX.search(urlsplit(url).path)
+    if match is None:
+        return float('inf')
+    size = match.group('size')
+    if size in _NAMED_SIZES:
+        pixels = _NAMED_SIZES[size]
+    else:
+        pixels = max(int(side) for side in size.split('x') if side)
+    return pixels * int(match.group('density') or 1)
+
+
+class ImageIndex:
+    """One entry per canonical image URL, with the contexts and products that use it"""
+
+    def __init__(self):
+        self._entries = {}
+        # Canonical URL -> insertion-ordered set of (context, product_id, product_title)
+        self._references = {}
+
+    def add(self, image):
+        """Add an image dict with at least src and context; return True if it is new
+
+        A duplicate only records its context/product back-reference; the first
+        entry's fields are kept, except that a larger rendition replaces its
+        src. Images without a src (the API sends null for some) are skipped.
+        """
+        if not image.get('src'):
+            return False
+        key = canonical_image_url(image['src'])
+        reference = (image.get('context'), image.get('product_id'), image.get('product_title'))
+        if key in self._entries:
+            self._references[key][reference] = None
+            entry = self._entries[key]
+            if rendition_size(image['src']) > rendition_size(entry['src']):
+                self._entries[key] = {**entry, 'src': image['src']}
+            return False
+
+        self._entries[key] = image
+        self._references[key] = {reference: None}
+        return True
+
+    @classmethod
+    def from_list(cls, images, exclude_context=None):
+        """Rebuild an index from as_list() output, optionally dropping one context's references"""
+        index = cls()
+        for image in images:
+            image = dict(image)
+            references = image.pop('references', None) or [image]
+            for reference in references:
+                if reference.get('context') == exclude_context:
+                    continue
+                index.add({**image, **reference})
+        return index
+
+    def count(self, context):
+        """Return how many images are referenced from a context"""
+        return sum(
+            1 for references in self._references.values()
+            if any(reference[0] == context for reference in references)
+        )
+
+    def as_list(self):
+        """Return entries as JSON-ready dicts, each with its back-references"""
+        return [
+            {**image, 'references': [self._reference_dict(reference) for reference in self._references[key]]}
+            for key, image in self._entries.items()
+        ]
+
+    def _reference_dict(self, reference):
+        context, product_id, product_title = reference
+        if product_id is None and product_title is None:
+            return {'context': context}
+        return {'context': context, 'product_id': product_id, 'product_title': product_title}
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
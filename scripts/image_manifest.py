@@ -0,0 +1,124 @@
+"""
+Persisted record of downloaded images for incremental sync (standard library only)
+
+For each image URL the manifest keeps the local path, the response's
+ETag/Last-Modified and the file's size, SHA-256 and MIME type. A file is
+present and valid when it still has the recorded size and hash; its mtime
+is recorded too, so an untouched file is trusted without being read
+again. Valid entries supply If-None-Match/If-Modified-Since headers, and a
+304 answer means the download is skipped. Paths are matched without their
+extension, since the downloader names files by the format it detects.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+DEFAULT_MANIFEST_PATH = '.scraper_cache/images/manifest.json'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path):
+    """Return the hex SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageManifest:
+    """URL-keyed validators, sizes and hashes of images already on disk"""
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.stats = {'unchanged': 0, 'stored': 0, 'invalid': 0}
+        self._lock = threading.Lock()
+        self._entries = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def conditional_headers(self, url, path):
+        """Return If-None-Match/If-Modified-Since headers if `path`, under any extension, holds a valid copy of `url`"""
+        entry = self._valid_entry(url, path)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def refresh(self, url, headers):
+        """Record a 304 for `url`, keeping any new validators; return the stored entry"""
+        with self._lock:
+            entry = self._entries[url]
+            entry['etag'] = headers.get('ETag') or entry.get('etag')
+            entry['last_modified'] = headers.get('Last-Modified') or entry.get('last_modified')
+            self.stats['unchanged'] += 1
+            return dict(entry)
+
+    def record(self, url, path, headers, size, sha256, mime=None):
+        """Record a freshly downloaded file and its validators"""
+        with self._lock:
+            self._entries[url] = {
+                'path': path,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'size': size,
+                'sha256': sha256,
+                'mime': mime,
+                'mtime_ns': os.stat(path).st_mtime_ns
+            }
+            self.stats['stored'] += 1
+
+    def rename(self, url, path, mime=None):
+        """Point an entry at the file's new name, e.g. after its extension was corrected"""
+        with self._lock:
+            entry = self._entries[url]
+            entry['path'] = path
+            entry['mime'] = mime or entry.get('mime')
+
+    def save(self):
+        """Persist the manifest so the next run can revalidate instead of downloading"""
+        with self._lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def _valid_entry(self, url, path):
+        with self._lock:
+            entry = self._entries.get(url)
+            entry = dict(entry) if entry and os.path.splitext(entry['path'])[0] == os.path.splitext(path)[0] else None
+        if entry is None:
+            return None
+
+        try:
+            stat = os.stat(entry['path'])
+            valid = stat.st_size == entry['size'] and (
+                stat.st_mtime_ns == entry['mtime_ns'] or file_sha256(entry['path']) == entry['sha256']
+            )
+        except OSError:
+            valid = False
+
+        with self._lock:
+            if not valid:
+                self._entries.pop(url, None)
+                self.stats['invalid'] += 1
+                return None
+            # Contents were confirmed by hash; trust the new mtime from now on
+            self._entries[url]['mtime_ns'] = stat.st_mtime_ns
+        return entry
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
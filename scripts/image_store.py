@@ -0,0 +1,73 @@
+"""
+Content-addressed image store with hard-linked file names (standard library only)
+
+Every downloaded image is filed under its SHA-256 as objects/ab/abcdef...,
+and its human-readable path under public/images is made a hard link to
+that object. The same bytes served under several URLs (shared logos,
+repeated gift-card art, ?v= variants) therefore occupy disk space once,
+however many names point at them. Where hard links are not possible the
+object is a copy instead.
+"""
+
+import os
+import shutil
+import threading
+
+DEFAULT_STORE_DIR = '.scraper_cache/images/objects'
+
+
+class ContentStore:
+    """SHA-256 keyed image objects that public file names hard-link to"""
+
+    def __init__(self, directory=DEFAULT_STORE_DIR):
+        self.directory = directory
+        self.stats = {'files': 0, 'objects': 0, 'duplicates': 0, 'bytes': 0, 'bytes_saved': 0, 'copied': 0}
+        self._lock = threading.Lock()
+        # Hash -> first path added in this run
+        self._paths = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def object_path(self, sha256):
+        return os.path.join(self.directory, sha256[:2], sha256)
+
+    def add(self, path, sha256):
+        """Link `path` to the object for its hash; return the first path added with the same bytes"""
+        object_path = self.object_path(sha256)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+
+        with self._lock:
+            if not os.path.exists(object_path):
+                self._link_or_copy(path, object_path)
+            elif not os.path.samefile(path, object_path):
+                # Same bytes already stored: swap the file for another link to the object
+                temp_path = f"{path}.link"
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                self._link_or_copy(object_path, temp_path)
+                os.replace(temp_path, path)
+
+            size = os.path.getsize(path)
+            first = self._paths.setdefault(sha256, path)
+            self.stats['files'] += 1
+            if first == path:
+                self.stats['objects'] += 1
+                self.stats['bytes'] += size
+            else:
+                self.stats['duplicates'] += 1
+                self.stats['bytes_saved'] += size
+            return first
+
+    def summary(self):
+        """Return a one-line report of this run's deduplication"""
+        stats = self.stats
+        copied = f", {stats['copied']} copied instead of linked" if stats['copied'] else ''
+        return (f"{stats['objects']} unique images for {stats['files']} files, {stats['duplicates']} duplicates "
+                f"({stats['bytes'] / 1e6:.1f} MB stored, {stats['bytes_saved'] / 1e6:.1f} MB saved{copied})")
+
+    def _link_or_copy(self, source, target):
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+            self.stats['copied'] += 1
@@ -0,0 +1,26 @@
+"""
+Change-aware JSON output files (standard library only)
+
+Scrapes and image syncs often produce exactly what is already on disk.
+write_json_if_changed leaves such files untouched, so their mtimes, git
+status and anything watching them only change when the content does.
+"""
+
+import json
+
+
+def write_json_if_changed(path, data, compact=False):
+    """Write data as JSON unless the file already holds identical content"""
+    if compact:
+        content = json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+    else:
+        content = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
@@ -0,0 +1,118 @@
+"""
+Incremental decoding of one top-level JSON array from a byte stream (standard library only)
+
+iter_array_items reads a document like {"products": [...]} chunk by chunk
+and yields each element of the named array as soon as its closing bracket
+arrives. Only the element being decoded and the current chunk are held in
+memory, never the whole body or the full decoded tree. Elements are decoded
+with the C-accelerated json.JSONDecoder.raw_decode; an element split across
+chunks is retried once the next chunk arrives.
+"""
+
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = ' \t\n\r'
+# Characters that can follow a complete value in valid JSON
+_DELIMITERS = _WHITESPACE + ',:]}'
+
+
+class _Buffer:
+    """Decoded text of the stream with a read position, refilled on demand"""
+
+    def __init__(self, chunks, encoding):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Append the next chunk, dropping consumed text; return False at end of stream"""
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        self.text = self.text[self.pos:]
+        self.pos = 0
+        if chunk is None:
+            self.eof = True
+            self.text += self.decoder.decode(b'', final=True)
+            return False
+        self.text += self.decoder.decode(chunk)
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or '' at end of stream"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars):
+        """Consume and return the next non-whitespace character, which must be one of chars"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.text, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value, reading more chunks as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete: at least double the pending text so large elements decode in O(n)
+                available = len(self.text) - self.pos
+                while self.fill() and len(self.text) - self.pos < 2 * available:
+                    pass
+                if len(self.text) - self.pos > available:
+                    continue
+                raise
+            # A number may continue in the next chunk: "1." and "1e" decode as 1, and so does
+            # a "1" at the buffer edge. Only a following delimiter proves the value is complete.
+            if (end == len(self.text) or self.text[end] not in _DELIMITERS) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(chunks, key, encoding='utf-8'):
+    """Yield each element of the array stored under `key` in a top-level JSON object
+
+    `chunks` is any iterable of bytes. Other top-level members are decoded
+    and discarded. The stream is always read to the end so the underlying
+    connection can be reused.
+    """
+    buffer = _Buffer(chunks, encoding)
+    buffer.expect('{')
+
+    if buffer.peek() == '}':
+        buffer.pos += 1
+    else:
+        while True:
+            name = buffer.value()
+            buffer.expect(':')
+            if name == key and buffer.peek() == '[':
+                buffer.pos += 1
+                if buffer.peek() == ']':
+                    buffer.pos += 1
+                else:
+                    while True:
+                        yield buffer.value()
+                        if buffer.expect(',]') == ']':
+                            break
+            else:
+                buffer.value()
+            if buffer.expect(',}') == '}':
+                break
+
+    # Drain anything after the closing brace
+    while buffer.fill():
+        buffer.pos = len(buffer.text)
@@ -0,0 +1,136 @@
+"""
+Readiness-based waits for Selenium page loads
+
+Each page type declares what "ready" means for it: document.readyState,
+selectors that must be present and, optionally, a quiet period with no
+network activity. wait_until_ready polls those conditions and returns as
+soon as they hold, falling back to a timeout instead of a fixed sleep.
+
+The quiet period is measured by a tracker that install_network_tracker adds
+to every document before navigation: it counts fetch/XHR calls still in
+flight and records when the last resource or request finished, using a
+PerformanceObserver so the 250-entry Resource Timing buffer can't hide
+late activity.
+"""
+
+import time
+import weakref
+
+# Runs before any page script; keeps window.__networkActivity up to date
+NETWORK_TRACKER_SCRIPT = """
+(() => {
+  if (window.__networkActivity) return;
+  const state = window.__networkActivity = {pending: 0, lastActivity: 0};
+  const touch = () => { state.lastActivity = performance.now(); };
+
+  if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(100000);
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) state.lastActivity = Math.max(state.lastActivity, entry.responseEnd);
+  }).observe({type: 'resource', buffered: true});
+
+  const fetch = window.fetch;
+  if (fetch) {
+    window.fetch = function (...args) {
+      state.pending++;
+      touch();
+      return fetch.apply(this, args).finally(() => { state.pending--; touch(); });
+    };
+  }
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    state.pending++;
+    touch();
+    this.addEventListener('loadend', () => { state.pending--; touch(); }, {once: true});
+    return send.apply(this, args);
+  };
+})();
+"""
+
+# Milliseconds the network has been idle: 0 while fetch/XHR calls are pending.
+# Without the tracker, falls back to the last finished resource in the timing buffer.
+NETWORK_QUIET_PROBE = """
+const state = window.__networkActivity;
+if (state) return state.pending > 0 ? 0 : performance.now() - state.lastActivity;
+const entries = performance.getEntriesByType('resource');
+const lastEnd = entries.reduce((latest, entry) => Math.max(latest, entry.responseEnd), 0);
+return performance.now() - lastEnd;
+"""
+
+_tracked_drivers = weakref.WeakSet()
+
+
+class PageReadiness:
+    """Conditions a page type must satisfy before extraction starts"""
+
+    def __init__(self, selectors=None, network_idle_ms=None, timeout=10):
+        self.selectors = selectors
+        self.network_idle_ms = network_idle_ms
+        self.timeout = timeout
+
+
+PAGE_READINESS = {
+    'homepage': PageReadiness(
+        selectors='img, .hero, .banner, .slider, [class*="hero"], [class*="banner"]',
+        network_idle_ms=500
+    ),
+    'product': PageReadiness(
+        selectors='h1, .product-title, form[action*="/cart/add"]',
+        network_idle_ms=500
+    ),
+    'policy': PageReadiness(
+        selectors='main, .content, .page-content, article'
+    ),
+    'structured_data': PageReadiness()
+}
+
+
+def install_network_tracker(driver):
+    """Inject the network activity tracker into every document this driver loads"""
+    if driver in _tracked_drivers:
+        return
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': NETWORK_TRACKER_SCRIPT})
+    _tracked_drivers.add(driver)
+
+
+def document_complete(driver):
+    """Condition: the document has finished parsing and loading"""
+    return driver.execute_script('return document.readyState') == 'complete'
+
+
+def selector_present(selectors):
+    """Condition factory: at least one element matches the selectors"""
+    def condition(driver):
+        # 'css selector' is By.CSS_SELECTOR; spelled out so selenium loads lazily
+        return bool(driver.find_elements('css selector', selectors))
+    return condition
+
+
+def network_quiet(idle_ms):
+    """Condition factory: no request in flight and none finished for idle_ms"""
+    def condition(driver):
+        return driver.execute_script(NETWORK_QUIET_PROBE) >= idle_ms
+    return condition
+
+
+def wait_until_ready(driver, page_type, poll_frequency=0.1):
+    """Wait until a page of the given type is ready; return False on timeout"""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    readiness = PAGE_READINESS[page_type]
+    conditions = [document_complete]
+    if readiness.selectors:
+        conditions.append(selector_present(readiness.selectors))
+    if readiness.network_idle_ms:
+        conditions.append(network_quiet(readiness.network_idle_ms))
+
+    # All conditions share a single deadline
+    deadline = time.monotonic() + readiness.timeout
+    try:
+        for condition in conditions:
+            remaining = max(deadline - time.monotonic(), 0)
+            WebDriverWait(driver, remaining, poll_frequency=poll_frequency).until(condition)
+    except TimeoutException:
+        print(f"  ⚠️ {page_type} page not ready after {readiness.timeout}s, continuing")
+        return False
+    return True
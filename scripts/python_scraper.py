@@ -4,34 +4,96 @@ Comprehensive Python scraper for Bad Boujee Hair website
 Extracts all products, images, content, and metadata
 """
 
+import argparse
+import asyncio
 import requests
 import json
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import os
 from datetime import datetime
+from shopify_pagination import page_url, resource_key, SHOPIFY_PAGE_LIMIT
+from catalog_store import CatalogStore
+from catalog_records import Product, Collection
+from catalog_encoding import encode_products
+from image_index import ImageIndex
+from http_cache import ResponseCache
+from page_readiness import install_network_tracker, wait_until_ready
+from resource_blocking import apply_resource_profile, CONTENT_SETTING_PREFS
+from browser_pool import BrowserPool
+from dom_extractors import combine_extractors, run_static_extractors
+from snapshot_archive import SnapshotArchive
+from html_text import html_to_text
+from json_stream import iter_array_items
+from json_output import write_json_if_changed
+
+DEFAULT_CACHE_DIR = '.scraper_cache/http'
+OUTPUT_DATA_FILE = 'python_scraped_data.json'
+# Written into metadata so a run can tell its own output from simple_python_scraper's, which shares the file name
+SCRAPING_METHOD = 'python_scraper'
+ENCODED_PRODUCTS_FILE = 'python_products.encoded.json'
+DEFAULT_SNAPSHOT_DIR = '.scraper_cache/snapshots'
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def parse_timestamp(value):
+    """Parse an ISO 8601 timestamp for ordering; unparseable values sort first"""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return float('-inf')
 
 class BadBoujeeHairScraper:
-    def __init__(self):
+    SHOPIFY_ENDPOINTS = [
+        '/products.json',
+        '/collections.json',
+        '/collections/all/products.json',
+        '/collections/ponytails/products.json',
+        '/collections/accessories/products.json',
+        '/collections/hair-care/products.json'
+    ]
+    
+    # What each browser stage reads from shared pages, as (path, extractor) pairs.
+    # render_page satisfies every declared need for a URL in a single visit.
+    STAGE_PAGE_NEEDS = {
+        'homepage_content': [('/', 'homepage')],
+        'structured_data': [('/', 'json_ld')]
+    }
+    
+    # Product page selectors shared by the static detail extractor
+    DESCRIPTION_SELECTOR = '.product-description, .product-content, [class*="description"]'
+    FEATURES_SELECTOR = '.product-features, .features, [class*="features"]'
+    SPECIFICATIONS_SELECTOR = '.specifications, .specs, [class*="specs"]'
+    CARE_SELECTOR = '.care-instructions, [class*="care"]'
+    GALLERY_IMAGE_SELECTOR = '.product-gallery img, .product-images img, [class*="gallery"] img'
+
+    def __init__(self, max_concurrency=6, request_timeout=10, cache_dir=DEFAULT_CACHE_DIR, cache_ttl=None, incremental=False,
+                 browser_workers=3, pages_per_browser=25, api_only=False,
+                 block_resources=True, resource_profiles=None, snapshot_dir=None, encoded_output=False):
         self.base_url = "https://www.badboujeehair.com"
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Size the connection pool so concurrent fetches don't queue on it
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Conditional-request cache so unchanged API pages come back as 304s
+        self.cache = ResponseCache(cache_dir, ttl=cache_ttl) if cache_dir else None
         
         # Data containers
         self.data = {
             'site_info': {},
-            'products': [],
-            'categories': [],
-            'images': [],
+            'products': CatalogStore(),
+            'categories': CatalogStore(),
+            'images': ImageIndex(),
             'content': {
                 'hero_sections': [],
                 'testimonials': [],
@@ -40,168 +102,331 @@ class BadBoujeeHairScraper:
                 'policies': {}
             },
             'metadata': {
+                'scraping_method': SCRAPING_METHOD,
                 'scraped_at': datetime.now().isoformat(),
                 'total_pages_scraped': 0,
                 'scraping_duration': 0
             }
         }
         
-        # Setup Selenium for JavaScript content
-        self.setup_selenium()
+        # Incremental mode reuses products whose updated_at hasn't changed
+        self.incremental = incremental
+        self.previous_products = {}
+        self.changed_handles = set()
+        
+        # Also write the dictionary-encoded products file
+        self.encoded_output = encoded_output
+        if incremental:
+            self.load_previous_run()
+        
+        # Parallel browsers for the per-page Selenium stages
+        self.browser_workers = browser_workers
+        self.pages_per_browser = pages_per_browser
+        
+        # Page type -> resource_blocking profile name; defaults to the page type's own profile
+        self.block_resources = block_resources
+        self.resource_profiles = resource_profiles or {}
+        
+        # URL -> {extractor: payload} for pages already rendered this run
+        self.rendered_pages = {}
+        
+        # Optional archive of rendered HTML for offline re-extraction
+        self.snapshots = SnapshotArchive(snapshot_dir) if snapshot_dir else None
+        
+        # Selenium starts lazily on first use; API-only runs never import it
+        self.api_only = api_only
+        self._driver = None
+        self._driver_failed = False
+    
+    def read_previous_output(self, path=OUTPUT_DATA_FILE):
+        """Return the previous run's saved data, or None if it can't be read or another scraper wrote it"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ No usable previous run in {path} ({e})")
+            return None
+        
+        # Output from before the marker existed still carries this scraper's watermark
+        metadata = previous.get('metadata') if isinstance(previous, dict) else None
+        if not isinstance(metadata, dict) or not (
+            metadata.get('scraping_method') == SCRAPING_METHOD or 'watermark' in metadata
+        ):
+            method = metadata.get('scraping_method') if isinstance(metadata, dict) else None
+            print(f"⚠️ {path} was not written by this scraper (scraping_method: {method})")
+            return None
+        return previous
+    
+    def load_previous_run(self, path=OUTPUT_DATA_FILE):
+        """Load products from the previous run for incremental comparison"""
+        previous = self.read_previous_output(path)
+        if previous is None:
+            print("⚠️ Scraping everything")
+            return
+        
+        self.previous_products = {
+            p['id']: p for p in previous.get('products', []) if p.get('id') is not None
+        }
+        watermark = previous.get('metadata', {}).get('watermark')
+        print(f"♻️ Loaded {len(self.previous_products)} products from previous run (watermark: {watermark})")
+    
+    @property
+    def driver(self):
+        """Shared WebDriver, started on first access; None in API-only mode or if setup failed"""
+        if self._driver is None and not self._driver_failed and not self.api_only:
+            self.setup_selenium()
+        return self._driver
+    
+    def browser_available(self):
+        """Whether browser stages can run, without launching the shared driver to find out"""
+        return not self.api_only and not self._driver_failed
+    
+    def release_driver(self):
+        """Quit the shared driver once no stage needs it, so pool stages run without an idle browser"""
+        if self._driver:
+            self._driver.quit()
+            self._driver = None
+    
+    def create_driver(self):
+        """Launch a headless Chrome WebDriver"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        if self.block_resources:
+            chrome_options.add_experimental_option('prefs', CONTENT_SETTING_PREFS)
+        return webdriver.Chrome(options=chrome_options)
+    
+    def load_page(self, driver, url, page_type):
+        """Navigate with the page type's resource-blocking profile and wait until ready"""
+        if self.block_resources:
+            apply_resource_profile(driver, self.resource_profiles.get(page_type, page_type))
+        # Must be in place before navigation so the page's own requests are counted
+        install_network_tracker(driver)
+        driver.get(url)
+        wait_until_ready(driver, page_type)
+    
+    def render_page(self, path, page_type, extractors, driver=None):
+        """Return extractor payloads for a page, navigating only if no earlier visit covered them"""
+        url = urljoin(self.base_url, path)
+        rendered = self.rendered_pages.get(url)
+        if rendered is not None and all(name in rendered for name in extractors):
+            return rendered
+        
+        # Extract everything any stage declared for this page while we're here
+        needed = set(extractors)
+        for needs in self.STAGE_PAGE_NEEDS.values():
+            needed.update(name for need_path, name in needs if need_path == path)
+        
+        driver = driver or self.driver
+        self.load_page(driver, url, page_type)
+        script, args = combine_extractors(needed)
+        rendered = driver.execute_script(script, args)
+        self.rendered_pages[url] = rendered
+        
+        if self.snapshots is not None:
+            self.snapshots.add(url, page_type, needed, driver.page_source)
+        return rendered
+    
+    def apply_rendered(self, url, rendered):
+        """Apply extractor payloads for a page to self.data, dispatching by extractor"""
+        path = urlparse(url).path
+        if 'homepage' in rendered:
+            self.apply_homepage_payload(rendered['homepage'])
+        if 'json_ld' in rendered:
+            self.apply_structured_data(rendered['json_ld'])
+        if 'reviews' in rendered:
+            self.apply_reviews(path.rstrip('/').split('/')[-1], rendered['reviews'])
+        if 'page_content' in rendered:
+            self.apply_page_content(path, rendered['page_content'])
+    
+    def browser_pool(self):
+        """Return a pool of parallel browsers for per-page stages"""
+        return BrowserPool(self.create_driver, size=self.browser_workers, pages_per_driver=self.pages_per_browser)
     
     def setup_selenium(self):
         """Setup Selenium WebDriver for JavaScript-heavy content"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self._driver = self.create_driver()
             print("✅ Selenium WebDriver initialized")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
-            self.driver = None
+            self._driver_failed = True
     
     def scrape_shopify_api(self):
         """Scrape Shopify API endpoints for product data"""
         print("🛒 Scraping Shopify API endpoints...")
+        asyncio.run(self.fetch_shopify_endpoints(self.SHOPIFY_ENDPOINTS))
+    
+    async def fetch_shopify_endpoints(self, endpoints):
+        """Fetch all endpoints concurrently and process records as they are decoded"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Bounded so decoding never runs far ahead of processing
+        results = asyncio.Queue(maxsize=self.max_concurrency)
         
-        endpoints = [
-            '/products.json',
-            '/collections.json',
-            '/collections/all/products.json',
-            '/collections/ponytails/products.json',
-            '/collections/accessories/products.json',
-            '/collections/hair-care/products.json'
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = self.base_url + endpoint
-                print(f"  └─ Trying {endpoint}...")
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            tasks = [
+                asyncio.create_task(self.fetch_endpoint(endpoint, semaphore, executor, results))
+                for endpoint in endpoints
+            ]
+            
+            # Each endpoint task puts its records followed by a None sentinel
+            remaining = len(tasks)
+            while remaining:
+                key, record = await results.get()
+                if record is None:
+                    remaining -= 1
+                    continue
+                try:
+                    if key == 'products':
+                        self.process_product(record)
+                    else:
+                        self.process_collection(record)
+                except Exception as e:
+                    print(f"    ❌ Error processing {key[:-1]} {record.get('id') if isinstance(record, dict) else record!r}: {e}")
+            
+            await asyncio.gather(*tasks)
+    
+    async def fetch_endpoint(self, endpoint, semaphore, executor, results):
+        """Stream an endpoint's records across pages onto the results queue"""
+        key = resource_key(endpoint)
+        count = 0
+        try:
+            url = self.base_url + endpoint
+            print(f"  └─ Trying {endpoint}...")
+            
+            loop = asyncio.get_running_loop()
+            page = 1
+            while True:
+                # A slot is held from opening a page's response until it is drained,
+                # so at most max_concurrency responses are open at once
+                async with semaphore:
+                    page_count = await self.stream_page(loop, executor, page_url(url, page), key, results)
+                count += page_count
                 
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if 'products' in data:
-                        print(f"    ✅ Found {len(data['products'])} products")
-                        for product in data['products']:
-                            self.process_product(product)
-                    
-                    if 'collections' in data:
-                        print(f"    ✅ Found {len(data['collections'])} collections")
-                        for collection in data['collections']:
-                            self.process_collection(collection)
-                            
-            except Exception as e:
-                print(f"    ❌ Error with {endpoint}: {e}")
+                # A short page is the last one
+                if page_count < SHOPIFY_PAGE_LIMIT:
+                    break
+                page += 1
+            
+            if count:
+                print(f"    ✅ Found {count} {key} from {endpoint}")
+                
+        except Exception as e:
+            print(f"    ❌ Error with {endpoint}: {e}")
+        finally:
+            await results.put((key, None))
+    
+    async def stream_page(self, loop, executor, url, key, results):
+        """Put one API page's records onto the results queue as they decode; return how many"""
+        records = await loop.run_in_executor(executor, self.stream_records, url, key)
+        count = 0
+        try:
+            # Each next() call reads just enough of the response to decode one record
+            records = iter(records)
+            while True:
+                record = await loop.run_in_executor(executor, next, records, None)
+                if record is None:
+                    return count
+                count += 1
+                await results.put((key, record))
+        finally:
+            # Release the connection if the page was abandoned part-way
+            if hasattr(records, 'close'):
+                records.close()
+    
+    def open_stream(self, url):
+        """GET a URL through the response cache as an iterator of body chunks, or None on a non-200 response"""
+        if self.cache:
+            chunks = self.cache.fresh_chunks(url)
+            if chunks is not None:
+                return chunks
+        
+        headers = self.cache.conditional_headers(url) if self.cache else {}
+        response = self.session.get(url, headers=headers, timeout=self.request_timeout, stream=True)
+        
+        if response.status_code == 304 and self.cache:
+            response.close()
+            chunks = self.cache.revalidated_chunks(url, response.headers)
+            if chunks is not None:
+                return chunks
+        
+        if response.status_code != 200:
+            response.close()
+            return None
+        
+        chunks = self.iter_response(response)
+        if self.cache:
+            chunks = self.cache.store_chunks(url, chunks, response.headers)
+        return chunks
+    
+    def iter_response(self, response):
+        """Yield a streamed response's decoded body, releasing the connection afterwards"""
+        with response:
+            yield from response.iter_content(STREAM_CHUNK_SIZE)
+    
+    def get_body(self, url):
+        """GET a URL through the response cache, or None on a non-200 response"""
+        chunks = self.open_stream(url)
+        return b''.join(chunks) if chunks is not None else None
+    
+    def get_json(self, url):
+        """GET a URL and decode its JSON body, or None on a non-200 response"""
+        body = self.get_body(url)
+        return json.loads(body) if body is not None else None
+    
+    def stream_records(self, url, key):
+        """Decode the records of one API page straight from the response stream"""
+        chunks = self.open_stream(url)
+        if chunks is None:
+            return []
+        return iter_array_items(chunks, key)
     
     def process_product(self, product):
         """Process and clean product data"""
-        processed_product = {
-            'id': product.get('id'),
-            'title': product.get('title'),
-            'handle': product.get('handle'),
-            'description': self.clean_html(product.get('description', '')),
-            'vendor': product.get('vendor'),
-            'product_type': product.get('product_type'),
-            'created_at': product.get('created_at'),
-            'updated_at': product.get('updated_at'),
-            'published_at': product.get('published_at'),
-            'tags': product.get('tags', []),
-            'available': product.get('available'),
-            'price_range': {
-                'min': None,
-                'max': None
-            },
-            'variants': [],
-            'images': [],
-            'options': product.get('options', []),
-            'seo': {
-                'title': product.get('title'),
-                'description': self.clean_html(product.get('description', ''))[:160]
-            }
-        }
+        # Skip duplicates before doing any normalization work
+        if product.get('id') in self.data['products']:
+            return
         
-        # Process variants
-        if 'variants' in product:
-            prices = []
-            for variant in product['variants']:
-                variant_data = {
-                    'id': variant.get('id'),
-                    'title': variant.get('title'),
-                    'price': float(variant.get('price', 0)),
-                    'compare_at_price': variant.get('compare_at_price'),
-                    'sku': variant.get('sku'),
-                    'inventory_quantity': variant.get('inventory_quantity'),
-                    'available': variant.get('available'),
-                    'weight': variant.get('weight'),
-                    'option1': variant.get('option1'),
-                    'option2': variant.get('option2'),
-                    'option3': variant.get('option3')
-                }
-                processed_product['variants'].append(variant_data)
-                if variant_data['price'] > 0:
-                    prices.append(variant_data['price'])
-            
-            if prices:
-                processed_product['price_range']['min'] = min(prices)
-                processed_product['price_range']['max'] = max(prices)
-        
-        # Process images
-        if 'images' in product:
-            for image in product['images']:
-                image_data = {
-                    'id': image.get('id'),
-                    'src': image.get('src'),
-                    'alt': image.get('alt', ''),
-                    'position': image.get('position'),
-                    'width': image.get('width'),
-                    'height': image.get('height'),
-                    'variant_ids': image.get('variant_ids', [])
-                }
-                processed_product['images'].append(image_data)
-                
-                # Add to global images collection
-                self.data['images'].append({
-                    'src': image_data['src'],
-                    'alt': image_data['alt'],
-                    'context': 'product',
-                    'product_id': product.get('id'),
-                    'product_title': product.get('title')
-                })
+        # Reuse the previous run's record (including detail fields) if unchanged
+        previous = self.previous_products.get(product.get('id'))
+        if previous and previous.get('updated_at') == product.get('updated_at'):
+            previous = Product.from_dict(previous)
+            self.data['products'].add(previous)
+            self.add_product_images(previous.id, previous.title, previous.images)
+            return
         
-        # Check for duplicates
-        existing_ids = [p['id'] for p in self.data['products']]
-        if processed_product['id'] not in existing_ids:
-            self.data['products'].append(processed_product)
+        if product.get('handle'):
+            self.changed_handles.add(product['handle'])
+        
+        # Variants, images and the price range are normalized into slotted records
+        processed_product = Product.from_api(product, self.clean_html(product.get('description', '')))
+        self.add_product_images(processed_product.id, processed_product.title, processed_product.images)
+        self.data['products'].add(processed_product)
+    
+    def add_product_images(self, product_id, product_title, images):
+        """Add a product's images to the global images collection"""
+        for image in images:
+            self.data['images'].add({
+                'src': image.src,
+                'alt': image.alt,
+                'context': 'product',
+                'product_id': product_id,
+                'product_title': product_title
+            })
     
     def process_collection(self, collection):
         """Process collection/category data"""
-        processed_collection = {
-            'id': collection.get('id'),
-            'title': collection.get('title'),
-            'handle': collection.get('handle'),
-            'description': self.clean_html(collection.get('description', '')),
-            'published_at': collection.get('published_at'),
-            'updated_at': collection.get('updated_at'),
-            'sort_order': collection.get('sort_order'),
-            'template_suffix': collection.get('template_suffix'),
-            'products_count': collection.get('products_count', 0),
-            'image': collection.get('image'),
-            'seo': {
-                'title': collection.get('title'),
-                'description': self.clean_html(collection.get('description', ''))[:160]
-            }
-        }
+        if collection.get('id') in self.data['categories']:
+            return
         
-        # Check for duplicates
-        existing_ids = [c['id'] for c in self.data['categories']]
-        if processed_collection['id'] not in existing_ids:
-            self.data['categories'].append(processed_collection)
+        processed_collection = Collection.from_api(collection, self.clean_html(collection.get('description', '')))
+        self.data['categories'].add(processed_collection)
     
     def scrape_homepage_content(self):
         """Scrape homepage content with Selenium"""
@@ -212,134 +437,172 @@ class BadBoujeeHairScraper:
             return
         
         try:
-            self.driver.get(self.base_url)
-            time.sleep(3)  # Wait for page load
-            
-            # Extract site metadata
-            self.data['site_info'] = {
-                'title': self.driver.title,
-                'description': self.get_meta_content('description'),
-                'keywords': self.get_meta_content('keywords'),
-                'og_title': self.get_meta_content('og:title'),
-                'og_description': self.get_meta_content('og:description'),
-                'og_image': self.get_meta_content('og:image'),
-                'canonical_url': self.get_canonical_url()
-            }
-            
-            # Extract hero sections
-            hero_elements = self.driver.find_elements(By.CSS_SELECTOR, '.hero, .banner, .slider, [class*="hero"], [class*="banner"]')
-            for hero in hero_elements:
-                try:
-                    hero_data = {
-                        'title': self.safe_get_text(hero, 'h1, h2, .title, [class*="title"]'),
-                        'subtitle': self.safe_get_text(hero, 'p, .subtitle, [class*="subtitle"]'),
-                        'cta_text': self.safe_get_text(hero, 'button, .btn, .cta, a[class*="btn"]'),
-                        'background_image': self.safe_get_attribute(hero, 'img', 'src'),
-                        'html': hero.get_attribute('outerHTML')[:500]  # First 500 chars
-                    }
-                    if hero_data['title'] or hero_data['subtitle']:
-                        self.data['content']['hero_sections'].append(hero_data)
-                except Exception as e:
-                    print(f"Error processing hero element: {e}")
-            
-            # Extract testimonials
-            testimonial_elements = self.driver.find_elements(By.CSS_SELECTOR, '.testimonial, .review, [class*="testimonial"], [class*="review"]')
-            for testimonial in testimonial_elements:
-                try:
-                    testimonial_data = {
-                        'name': self.safe_get_text(testimonial, '.name, .author, [class*="name"], [class*="author"]'),
-                        'text': self.safe_get_text(testimonial, '.text, .content, p'),
-                        'rating': len(testimonial.find_elements(By.CSS_SELECTOR, '.star, [class*="star"]')),
-                        'image': self.safe_get_attribute(testimonial, 'img', 'src')
-                    }
-                    if testimonial_data['name'] or testimonial_data['text']:
-                        self.data['content']['testimonials'].append(testimonial_data)
-                except Exception as e:
-                    print(f"Error processing testimonial: {e}")
-            
-            # Extract all images
-            images = self.driver.find_elements(By.TAG_NAME, 'img')
-            for img in images:
-                try:
-                    src = img.get_attribute('src') or img.get_attribute('data-src')
-                    if src and not src.startswith('data:'):
-                        image_data = {
-                            'src': urljoin(self.base_url, src),
-                            'alt': img.get_attribute('alt') or '',
-                            'width': img.get_attribute('width'),
-                            'height': img.get_attribute('height'),
-                            'context': 'homepage',
-                            'lazy_loaded': bool(img.get_attribute('data-src'))
-                        }
-                        self.data['images'].append(image_data)
-                except Exception as e:
-                    continue
+            # One visit and one execute_script round trip serve every homepage stage
+            rendered = self.render_page('/', 'homepage', ['homepage'])
+            self.apply_homepage_payload(rendered['homepage'])
             
             print(f"✅ Extracted {len(self.data['content']['hero_sections'])} hero sections")
             print(f"✅ Extracted {len(self.data['content']['testimonials'])} testimonials")
-            print(f"✅ Extracted {len([img for img in self.data['images'] if img['context'] == 'homepage'])} homepage images")
+            print(f"✅ Extracted {self.data['images'].count('homepage')} homepage images")
             
         except Exception as e:
             print(f"❌ Error scraping homepage: {e}")
     
+    def apply_homepage_payload(self, payload):
+        """Store site metadata, heroes, testimonials and images from a homepage payload"""
+        meta = payload['meta']
+        self.data['site_info'] = {
+            'title': payload['title'],
+            'description': meta.get('description', ''),
+            'keywords': meta.get('keywords', ''),
+            'og_title': meta.get('og:title', ''),
+            'og_description': meta.get('og:description', ''),
+            'og_image': meta.get('og:image', ''),
+            'canonical_url': payload['canonical_url']
+        }
+        
+        for hero_data in payload['heroes']:
+            if hero_data['title'] or hero_data['subtitle']:
+                self.data['content']['hero_sections'].append(hero_data)
+        
+        for testimonial_data in payload['testimonials']:
+            if testimonial_data['name'] or testimonial_data['text']:
+                self.data['content']['testimonials'].append(testimonial_data)
+        
+        for img in payload['images']:
+            src = img['src'] or img['data_src']
+            if src and not src.startswith('data:'):
+                self.data['images'].add({
+                    'src': urljoin(self.base_url, src),
+                    'alt': img['alt'],
+                    'width': img['width'],
+                    'height': img['height'],
+                    'context': 'homepage',
+                    'lazy_loaded': bool(img['data_src'])
+                })
+    
+    def detail_handles(self):
+        """Return the product handles whose detail pages need (re)visiting"""
+        product_handles = self.data['products'].handles()
+        if self.incremental:
+            product_handles = [h for h in product_handles if h in self.changed_handles]
+        return product_handles
+    
+    def scrape_product_details(self):
+        """Fetch product details from static JSON and HTML, without a browser"""
+        print("📦 Fetching product details...")
+        
+        handles = self.detail_handles()
+        if self.incremental:
+            print(f"  ♻️ {len(handles)} changed products to re-fetch")
+        if handles:
+            asyncio.run(self.fetch_product_details(handles))
+    
+    async def fetch_product_details(self, handles):
+        """Fetch every product's details concurrently and apply them as they arrive"""
+        loop = asyncio.get_running_loop()
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            tasks = [loop.run_in_executor(executor, self.fetch_product_detail, handle) for handle in handles]
+            
+            fetched = 0
+            for completed in asyncio.as_completed(tasks):
+                handle, details = await completed
+                product = self.data['products'].by_handle(handle)
+                if product and details:
+                    product.add_details(details)
+                    fetched += 1
+        
+        print(f"  ✅ Fetched details for {fetched}/{len(handles)} products")
+    
+    def fetch_product_detail(self, handle):
+        """Fetch /products/{handle}.json and the product page; return (handle, details)"""
+        details = {}
+        try:
+            data = self.get_json(f"{self.base_url}/products/{handle}.json")
+            product = (data or {}).get('product') or {}
+            if product:
+                details['detailed_description'] = self.clean_html(product.get('body_html', ''))
+                details['gallery_images'] = [
+                    {'src': urljoin(self.base_url, image['src']), 'alt': image.get('alt') or ''}
+                    for image in product.get('images', []) if image.get('src')
+                ]
+            
+            page = self.get_body(f"{self.base_url}/products/{handle}")
+            if page:
+                details.update(self.extract_product_page(page, details))
+                
+        except Exception as e:
+            print(f"    ❌ Error fetching details for {handle}: {e}")
+        
+        return handle, details
+    
+    def extract_product_page(self, page, details):
+        """Extract detail fields and JSON-LD from a product page's static HTML"""
+        soup = BeautifulSoup(page, 'html.parser')
+        extracted = {
+            'features': self.soup_list_items(soup, self.FEATURES_SELECTOR),
+            'specifications': self.soup_list_items(soup, self.SPECIFICATIONS_SELECTOR),
+            'care_instructions': self.soup_text(soup, self.CARE_SELECTOR)
+        }
+        
+        # The rendered description block wins over the API's body_html when present
+        description = self.soup_text(soup, self.DESCRIPTION_SELECTOR)
+        if description or 'detailed_description' not in details:
+            extracted['detailed_description'] = description
+        
+        if not details.get('gallery_images'):
+            extracted['gallery_images'] = []
+            for img in soup.select(self.GALLERY_IMAGE_SELECTOR):
+                src = img.get('src') or img.get('data-src')
+                if src:
+                    extracted['gallery_images'].append({
+                        'src': urljoin(self.base_url, src),
+                        'alt': img.get('alt') or ''
+                    })
+        
+        for script in soup.select('script[type="application/ld+json"]'):
+            try:
+                structured_data = json.loads(script.string or '')
+            except json.JSONDecodeError:
+                continue
+            items = structured_data if isinstance(structured_data, list) else [structured_data]
+            product_data = next((item for item in items if isinstance(item, dict) and item.get('@type') == 'Product'), None)
+            if product_data:
+                extracted['structured_data'] = product_data
+                break
+        
+        return extracted
+    
     def scrape_individual_products(self):
-        """Scrape individual product pages for detailed info"""
-        print("🎯 Scraping individual product pages...")
+        """Scrape JS-rendered review widgets from individual product pages"""
+        print("🎯 Scraping product reviews...")
         
-        if not self.driver:
+        if not self.browser_available():
             print("❌ No Selenium driver available")
             return
         
-        # Get product handles from already scraped products
-        product_handles = [p['handle'] for p in self.data['products'] if p.get('handle')][:10]  # Limit to first 10
+        # Everything else comes from scrape_product_details; reviews need JS
+        product_handles = self.detail_handles()[:10]  # Limit to first 10
         
-        for handle in product_handles:
-            try:
-                url = f"{self.base_url}/products/{handle}"
-                print(f"  └─ Scraping {handle}...")
-                
-                self.driver.get(url)
-                time.sleep(2)
-                
-                # Find the product in our data
-                product = next((p for p in self.data['products'] if p['handle'] == handle), None)
-                if not product:
-                    continue
-                
-                # Extract additional details
-                product['detailed_description'] = self.safe_get_text(self.driver, '.product-description, .product-content, [class*="description"]')
-                product['features'] = self.extract_list_items('.product-features, .features, [class*="features"]')
-                product['specifications'] = self.extract_list_items('.specifications, .specs, [class*="specs"]')
-                product['care_instructions'] = self.safe_get_text(self.driver, '.care-instructions, [class*="care"]')
-                
-                # Extract gallery images
-                gallery_images = self.driver.find_elements(By.CSS_SELECTOR, '.product-gallery img, .product-images img, [class*="gallery"] img')
-                product['gallery_images'] = []
-                for img in gallery_images:
-                    src = img.get_attribute('src') or img.get_attribute('data-src')
-                    if src:
-                        product['gallery_images'].append({
-                            'src': urljoin(self.base_url, src),
-                            'alt': img.get_attribute('alt') or ''
-                        })
-                
-                # Extract reviews/ratings
-                reviews = self.driver.find_elements(By.CSS_SELECTOR, '.review, [class*="review"]')
-                product['reviews'] = []
-                for review in reviews[:5]:  # Limit to first 5 reviews
-                    review_data = {
-                        'author': self.safe_get_text(review, '.author, .name, [class*="author"], [class*="name"]'),
-                        'rating': len(review.find_elements(By.CSS_SELECTOR, '.star, [class*="star"]')),
-                        'text': self.safe_get_text(review, '.text, .content, p'),
-                        'date': self.safe_get_text(review, '.date, [class*="date"]')
-                    }
-                    if review_data['author'] or review_data['text']:
-                        product['reviews'].append(review_data)
-                
-                time.sleep(1)  # Be respectful
-                
-            except Exception as e:
-                print(f"    ❌ Error scraping {handle}: {e}")
+        for handle, reviews in self.browser_pool().run(product_handles, self.visit_product_reviews):
+            if reviews is not None:
+                self.apply_reviews(handle, reviews)
+    
+    def visit_product_reviews(self, driver, handle):
+        """Load a product page in a pool browser and return its reviews"""
+        print(f"  └─ Scraping {handle}...")
+        # Extract reviews/ratings (first 5) in one round trip
+        reviews = self.render_page(f"/products/{handle}", 'product', ['reviews'], driver)['reviews']
+        
+        time.sleep(1)  # Be respectful
+        return reviews
+    
+    def apply_reviews(self, handle, reviews):
+        """Attach extracted reviews with an author or text to a product"""
+        product = self.data['products'].by_handle(handle)
+        if product:
+            product.add_details({'reviews': [r for r in reviews if r['author'] or r['text']]})
     
     def scrape_additional_pages(self):
         """Scrape additional important pages"""
@@ -355,27 +618,27 @@ class BadBoujeeHairScraper:
             '/pages/terms-of-service'
         ]
         
-        for page in pages:
-            try:
-                url = self.base_url + page
-                if self.driver:
-                    self.driver.get(url)
-                    time.sleep(2)
-                    
-                    content = self.safe_get_text(self.driver, 'main, .content, .page-content, article')
-                    title = self.safe_get_text(self.driver, 'h1, .page-title')
-                    
-                    if content:
-                        page_name = page.split('/')[-1].replace('-', '_')
-                        self.data['content']['policies'][page_name] = {
-                            'title': title,
-                            'content': content[:1000],  # First 1000 chars
-                            'url': page
-                        }
-                        print(f"  ✅ Scraped {page}")
-                
-            except Exception as e:
-                print(f"  ❌ Error scraping {page}: {e}")
+        if not self.browser_available():
+            return
+        
+        for page, extracted in self.browser_pool().run(pages, self.visit_page_content):
+            if extracted:
+                self.apply_page_content(page, extracted)
+    
+    def apply_page_content(self, page, extracted):
+        """Store a content page's title and text under its policy name"""
+        if extracted['content']:
+            page_name = page.split('/')[-1].replace('-', '_')
+            self.data['content']['policies'][page_name] = {
+                'title': extracted['title'],
+                'content': extracted['content'][:1000],  # First 1000 chars
+                'url': page
+            }
+            print(f"  ✅ Scraped {page}")
+    
+    def visit_page_content(self, driver, page):
+        """Load a content page in a pool browser and return its title and text"""
+        return self.render_page(page, 'policy', ['page_content'], driver)['page_content']
     
     def extract_structured_data(self):
         """Extract JSON-LD structured data"""
@@ -385,47 +648,46 @@ class BadBoujeeHairScraper:
             return
         
         try:
-            self.driver.get(self.base_url)
-            time.sleep(2)
-            
-            # Find JSON-LD scripts
-            scripts = self.driver.find_elements(By.CSS_SELECTOR, 'script[type="application/ld+json"]')
-            
-            for script in scripts:
-                try:
-                    content = script.get_attribute('innerHTML')
-                    if content:
-                        structured_data = json.loads(content)
-                        
-                        # Process different types of structured data
-                        if isinstance(structured_data, dict):
-                            if structured_data.get('@type') == 'Organization':
-                                self.data['site_info']['organization'] = structured_data
-                            elif structured_data.get('@type') == 'Product':
-                                # Find matching product and enhance it
-                                product_name = structured_data.get('name')
-                                if product_name:
-                                    matching_product = next((p for p in self.data['products'] if p['title'] == product_name), None)
-                                    if matching_product:
-                                        matching_product['structured_data'] = structured_data
-                        
-                        elif isinstance(structured_data, list):
-                            for item in structured_data:
-                                if item.get('@type') == 'Product':
-                                    product_name = item.get('name')
-                                    if product_name:
-                                        matching_product = next((p for p in self.data['products'] if p['title'] == product_name), None)
-                                        if matching_product:
-                                            matching_product['structured_data'] = item
-                
-                except json.JSONDecodeError:
-                    continue
-                except Exception as e:
-                    print(f"Error processing structured data: {e}")
+            # Usually served from the homepage stage's visit without navigating again
+            rendered = self.render_page('/', 'structured_data', ['json_ld'])
+            self.apply_structured_data(rendered['json_ld'])
         
         except Exception as e:
             print(f"❌ Error extracting structured data: {e}")
     
+    def apply_structured_data(self, json_ld_blocks):
+        """Attach JSON-LD Organization and Product data from a page's script blocks"""
+        for content in json_ld_blocks:
+            try:
+                if content:
+                    structured_data = json.loads(content)
+                    
+                    # Process different types of structured data
+                    if isinstance(structured_data, dict):
+                        if structured_data.get('@type') == 'Organization':
+                            self.data['site_info']['organization'] = structured_data
+                        elif structured_data.get('@type') == 'Product':
+                            # Find matching product and enhance it
+                            product_name = structured_data.get('name')
+                            if product_name:
+                                matching_product = self.data['products'].by_title(product_name)
+                                if matching_product:
+                                    matching_product.add_details({'structured_data': structured_data})
+                    
+                    elif isinstance(structured_data, list):
+                        for item in structured_data:
+                            if item.get('@type') == 'Product':
+                                product_name = item.get('name')
+                                if product_name:
+                                    matching_product = self.data['products'].by_title(product_name)
+                                    if matching_product:
+                                        matching_product.add_details({'structured_data': item})
+            
+            except json.JSONDecodeError:
+                continue
+            except Exception as e:
+                print(f"Error processing structured data: {e}")
+    
     def analyze_and_enhance_data(self):
         """Analyze scraped data and add insights"""
         print("🔍 Analyzing and enhancing data...")
@@ -434,10 +696,10 @@ class BadBoujeeHairScraper:
         if self.data['products']:
             prices = []
             for product in self.data['products']:
-                if product['price_range']['min']:
-                    prices.append(product['price_range']['min'])
-                if product['price_range']['max']:
-                    prices.append(product['price_range']['max'])
+                if product.min_price:
+                    prices.append(product.min_price)
+                if product.max_price:
+                    prices.append(product.max_price)
             
             if prices:
                 self.data['metadata']['price_analysis'] = {
@@ -450,7 +712,7 @@ class BadBoujeeHairScraper:
             # Product type analysis
             product_types = {}
             for product in self.data['products']:
-                ptype = product.get('product_type', 'Uncategorized')
+                ptype = product.product_type
                 product_types[ptype] = product_types.get(ptype, 0) + 1
             
             self.data['metadata']['product_type_distribution'] = product_types
@@ -458,20 +720,20 @@ class BadBoujeeHairScraper:
             # Vendor analysis
             vendors = {}
             for product in self.data['products']:
-                vendor = product.get('vendor', 'Unknown')
+                vendor = product.vendor
                 vendors[vendor] = vendors.get(vendor, 0) + 1
             
             self.data['metadata']['vendor_distribution'] = vendors
+            
+            # Watermark for the next incremental run
+            updated = [p.updated_at for p in self.data['products'] if p.updated_at]
+            if updated:
+                self.data['metadata']['watermark'] = max(updated, key=parse_timestamp)
+            if self.incremental:
+                self.data['metadata']['changed_products'] = len(self.changed_handles)
         
-        # Image analysis
-        unique_images = {}
-        for image in self.data['images']:
-            url = image['src']
-            if url not in unique_images:
-                unique_images[url] = image
-        
-        self.data['images'] = list(unique_images.values())
-        self.data['metadata']['total_unique_images'] = len(unique_images)
+        # Images are deduplicated by canonical URL as they are added
+        self.data['metadata']['total_unique_images'] = len(self.data['images'])
         
         # Content analysis
         self.data['metadata']['content_stats'] = {
@@ -490,17 +752,20 @@ class BadBoujeeHairScraper:
         # Calculate scraping duration
         self.data['metadata']['scraping_duration'] = time.time() - self.start_time
         
-        # Save comprehensive data
-        with open('python_scraped_data.json', 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False, default=str)
+        # Records are converted to the JSON schema once, here
+        exported = self.export_data()
         
-        # Save products separately
-        with open('python_products.json', 'w', encoding='utf-8') as f:
-            json.dump(self.data['products'], f, indent=2, ensure_ascii=False, default=str)
+        # Save comprehensive data
+        with open(OUTPUT_DATA_FILE, 'w', encoding='utf-8') as f:
+            json.dump(exported, f, indent=2, ensure_ascii=False, default=str)
         
-        # Save images separately
-        with open('python_images.json', 'w', encoding='utf-8') as f:
-            json.dump(self.data['images'], f, indent=2, ensure_ascii=False, default=str)
+        # Save products and images separately, skipping files that haven't changed
+        if not write_json_if_changed('python_products.json', exported['products']):
+            print("♻️ python_products.json unchanged")
+        if not write_json_if_changed('python_images.json', exported['images']):
+            print("♻️ python_images.json unchanged")
+        if self.encoded_output and not write_json_if_changed(ENCODED_PRODUCTS_FILE, encode_products(exported['products']), compact=True):
+            print(f"♻️ {ENCODED_PRODUCTS_FILE} unchanged")
         
         # Save summary report
         summary = {
@@ -523,64 +788,81 @@ class BadBoujeeHairScraper:
         print(f"✅ Images saved to python_images.json")
         print(f"✅ Summary saved to scraping_summary.json")
     
+    def export_data(self):
+        """Return self.data with catalog records converted to JSON dicts"""
+        return {
+            **self.data,
+            'products': self.data['products'].as_list(),
+            'categories': self.data['categories'].as_list(),
+            'images': self.data['images'].as_list()
+        }
+    
     def cleanup(self):
         """Cleanup resources"""
-        if self.driver:
-            self.driver.quit()
+        if self._driver:
+            self._driver.quit()
+        if self.cache:
+            self.cache.save()
+            print(f"🗄️ Cache: {self.cache.stats}")
+        if self.snapshots is not None:
+            self.snapshots.save()
     
     # Helper methods
     def clean_html(self, text):
-        """Remove HTML tags and clean text"""
-        if not text:
-            return ""
-        soup = BeautifulSoup(text, 'html.parser')
-        return soup.get_text().strip()
-    
-    def get_meta_content(self, name):
-        """Get meta tag content"""
-        try:
-            element = self.driver.find_element(By.CSS_SELECTOR, f'meta[name="{name}"], meta[property="{name}"]')
-            return element.get_attribute('content')
-        except:
-            return ""
+        """Remove HTML tags and clean text (streaming parser, memoized by content hash)"""
+        return html_to_text(text)
     
-    def get_canonical_url(self):
-        """Get canonical URL"""
-        try:
-            element = self.driver.find_element(By.CSS_SELECTOR, 'link[rel="canonical"]')
-            return element.get_attribute('href')
-        except:
-            return ""
+    def soup_text(self, soup, selector):
+        """Get stripped text of the first element matching selector in a parsed page"""
+        element = soup.select_one(selector)
+        return element.get_text(' ', strip=True) if element else ""
     
-    def safe_get_text(self, parent, selector):
-        """Safely get text from element"""
-        try:
-            if hasattr(parent, 'find_element'):
-                element = parent.find_element(By.CSS_SELECTOR, selector)
-            else:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            return element.text.strip()
-        except:
-            return ""
-    
-    def safe_get_attribute(self, parent, selector, attribute):
-        """Safely get attribute from element"""
-        try:
-            if hasattr(parent, 'find_element'):
-                element = parent.find_element(By.CSS_SELECTOR, selector)
-            else:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            return element.get_attribute(attribute)
-        except:
-            return ""
+    def soup_list_items(self, soup, selector):
+        """Extract li/p texts under any part of a comma-separated selector"""
+        item_selector = ', '.join(f'{part.strip()} {tag}' for part in selector.split(',') for tag in ('li', 'p'))
+        return [text for text in (elem.get_text(strip=True) for elem in soup.select(item_selector)) if text]
     
-    def extract_list_items(self, selector):
-        """Extract list items as array"""
-        try:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, f'{selector} li, {selector} p')
-            return [elem.text.strip() for elem in elements if elem.text.strip()]
-        except:
-            return []
+    def run_reextraction(self):
+        """Re-run the page extractors over archived snapshots, without a browser"""
+        self.start_time = time.time()
+        
+        # The outputs are rewritten, so refuse rather than replace a previous run with less
+        if not len(self.snapshots):
+            print(f"❌ No archived pages in {self.snapshots.directory}; run with --snapshots first")
+            return False
+        previous = self.read_previous_output()
+        if previous is None:
+            print("❌ Re-extraction needs the previous run's output to rebuild from")
+            return False
+        
+        print(f"🗃️ Re-extracting {len(self.snapshots)} archived pages...")
+        print("=" * 60)
+        
+        # Everything starts from the previous run; only pages present in the archive are rebuilt
+        rebuild_homepage = any('homepage' in entry['extractors'] for _, entry in self.snapshots)
+        self.data['products'] = CatalogStore(Product.from_dict(p) for p in previous.get('products', []))
+        self.data['categories'] = CatalogStore(Collection.from_dict(c) for c in previous.get('categories', []))
+        self.data['images'] = ImageIndex.from_list(
+            previous.get('images', []), exclude_context='homepage' if rebuild_homepage else None
+        )
+        self.data['site_info'] = previous.get('site_info', {})
+        self.data['content'].update(previous.get('content', {}))
+        if rebuild_homepage:
+            # Re-extraction appends these, so drop the previous copies first
+            self.data['content']['hero_sections'] = []
+            self.data['content']['testimonials'] = []
+        
+        for url, entry in self.snapshots:
+            try:
+                rendered = run_static_extractors(self.snapshots.read(url), entry['extractors'], url)
+                self.apply_rendered(url, rendered)
+            except Exception as e:
+                print(f"  ❌ Error re-extracting {url}: {e}")
+        
+        self.analyze_and_enhance_data()
+        self.save_data()
+        print(f"🎉 Re-extraction finished in {time.time() - self.start_time:.2f} seconds")
+        return True
     
     def run_full_scrape(self):
         """Run the complete scraping process"""
@@ -593,22 +875,31 @@ class BadBoujeeHairScraper:
             # 1. Scrape Shopify API for product data
             self.scrape_shopify_api()
             
-            # 2. Scrape homepage content
-            self.scrape_homepage_content()
+            # 2. Fetch product details from static JSON/HTML
+            self.scrape_product_details()
             
-            # 3. Scrape individual product pages
-            self.scrape_individual_products()
-            
-            # 4. Scrape additional pages
-            self.scrape_additional_pages()
-            
-            # 5. Extract structured data
-            self.extract_structured_data()
+            if self.api_only:
+                print("⏭️ API-only mode: skipping browser stages")
+            else:
+                # 3. Scrape homepage content
+                self.scrape_homepage_content()
+                
+                # 4. Extract structured data (served from the homepage visit)
+                self.extract_structured_data()
+                
+                # The pool stages launch their own browsers
+                self.release_driver()
+                
+                # 5. Scrape JS-rendered product reviews
+                self.scrape_individual_products()
+                
+                # 6. Scrape additional pages
+                self.scrape_additional_pages()
             
-            # 6. Analyze and enhance data
+            # 7. Analyze and enhance data
             self.analyze_and_enhance_data()
             
-            # 7. Save all data
+            # 8. Save all data
             self.save_data()
             
             print("=" * 60)
@@ -627,5 +918,36 @@ class BadBoujeeHairScraper:
             self.cleanup()
 
 if __name__ == "__main__":
-    scraper = BadBoujeeHairScraper()
-    scraper.run_full_scrape()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Comprehensive Bad Boujee Hair scraper")
+    parser.add_argument('--concurrency', type=int, default=6, help="Maximum concurrent API requests")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="HTTP response cache directory")
+    parser.add_argument('--cache-ttl', type=float, help="Serve cached responses younger than this many seconds without revalidating")
+    parser.add_argument('--no-cache', action='store_true', help="Disable the HTTP response cache")
+    parser.add_argument('--incremental', action='store_true', help=f"Reuse unchanged products from the previous {OUTPUT_DATA_FILE}")
+    parser.add_argument('--browsers', type=int, default=3, help="Parallel headless Chrome workers for per-page stages")
+    parser.add_argument('--pages-per-browser', type=int, default=25, help="Recycle each browser after this many pages")
+    parser.add_argument('--api-only', action='store_true', help="Only use the Shopify JSON API and static pages; never start a browser")
+    parser.add_argument('--no-block-resources', action='store_true', help="Let Chrome load images, fonts and third-party scripts")
+    parser.add_argument('--snapshots', action='store_true', help="Archive every rendered page's HTML in --snapshot-dir")
+    parser.add_argument('--snapshot-dir', default=DEFAULT_SNAPSHOT_DIR, help="Rendered-HTML snapshot archive directory")
+    parser.add_argument('--reextract', action='store_true', help="Re-run extractors over the snapshot archive instead of scraping")
+    parser.add_argument('--encoded-output', action='store_true', help=f"Also write dictionary-encoded products to {ENCODED_PRODUCTS_FILE} (decode with catalog_encoding.py)")
+    args = parser.parse_args()
+    
+    scraper = BadBoujeeHairScraper(
+        max_concurrency=args.concurrency,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_ttl=args.cache_ttl,
+        incremental=args.incremental,
+        browser_workers=args.browsers,
+        pages_per_browser=args.pages_per_browser,
+        api_only=args.api_only,
+        block_resources=not args.no_block_resources,
+        snapshot_dir=args.snapshot_dir if args.snapshots or args.reextract else None,
+        encoded_output=args.encoded_output
+    )
+    if args.reextract:
+        scraper.run_reextraction()
+        scraper.cleanup()
+    else:
+        scraper.run_full_scrape()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Per-stage resource blocking for headless Chrome
+
+The Selenium stages only read the DOM, so image pixels, web fonts, media,
+analytics and chat widgets are dead weight. Each stage names a profile of
+URL patterns that are blocked through the Chrome DevTools Protocol
+(Network.setBlockedURLs). Blocked images keep their src attributes in the
+DOM, so image extraction still works without fetching any pixels.
+"""
+
+import weakref
+
+IMAGE_PATTERNS = [
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*'
+]
+
+FONT_PATTERNS = ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*', '*fonts.googleapis.com*', '*fonts.shopifycdn.com*']
+
+MEDIA_PATTERNS = ['*.mp4*', '*.webm*', '*.mov*', '*.mp3*', '*youtube.com/embed*', '*player.vimeo.com*']
+
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*connect.facebook.net*', '*analytics.tiktok.com*', '*ct.pinterest.com*',
+    '*sc-static.net*', '*hotjar.com*', '*clarity.ms*', '*static.klaviyo.com*',
+    '*monorail-edge.shopifysvc.com*', '*/shopifycloud/perf-kit/*'
+]
+
+CHAT_PATTERNS = ['*gorgias.chat*', '*tidio.co*', '*intercom.io*', '*zdassets.com*', '*shopify-chat*']
+
+# Review widgets render the testimonials and product reviews we scrape
+REVIEW_WIDGET_PATTERNS = ['*judge.me*', '*yotpo.com*', '*okendo.io*', '*stamped.io*', '*loox.io*']
+
+_BASE_PATTERNS = IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS + CHAT_PATTERNS
+
+RESOURCE_PROFILES = {
+    'none': [],
+    'homepage': _BASE_PATTERNS,
+    'product': _BASE_PATTERNS,
+    'policy': _BASE_PATTERNS + REVIEW_WIDGET_PATTERNS,
+    'structured_data': _BASE_PATTERNS + REVIEW_WIDGET_PATTERNS
+}
+
+# Chrome content settings applied at launch (2 = block). Images are deliberately
+# left out: they are blocked per stage by the profiles above, so a stage mapped
+# to 'none' still loads them.
+CONTENT_SETTING_PREFS = {
+    'profile.managed_default_content_settings.media_stream': 2,
+    'profile.managed_default_content_settings.notifications': 2,
+    'profile.managed_default_content_settings.geolocation': 2
+}
+
+_applied_profiles = weakref.WeakKeyDictionary()
+
+
+def apply_resource_profile(driver, profile):
+    """Block the profile's URL patterns on this driver, skipping if already applied"""
+    if _applied_profiles.get(driver) == profile:
+        return
+
+    if driver not in _applied_profiles:
+        driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': RESOURCE_PROFILES[profile]})
+    _applied_profiles[driver] = profile
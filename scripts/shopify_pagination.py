@@ -0,0 +1,51 @@
+"""
+Lazy pagination over Shopify storefront JSON endpoints (standard library only)
+
+Shopify returns at most 250 records per page from /products.json and
+/collections.json, and only 30 when no limit is given. These helpers walk
+?limit=250&page=N one page at a time, decoding each page as it streams, so
+callers never hold more than the record being decoded. A page holding
+fewer than `limit` records is the last one, so no request is spent
+discovering an empty trailing page.
+"""
+
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+SHOPIFY_PAGE_LIMIT = 250
+
+
+def resource_key(endpoint):
+    """Return the top-level JSON key ('products' or 'collections') for an endpoint"""
+    path = urlsplit(endpoint).path.rstrip('/')
+    if path.endswith('/products.json'):
+        return 'products'
+    if path.endswith('/collections.json'):
+        return 'collections'
+    return None
+
+
+def page_url(url, page, limit=SHOPIFY_PAGE_LIMIT):
+    """Return url with its limit/page query parameters set"""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query['limit'] = str(limit)
+    query['page'] = str(page)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def iter_streamed_records(stream_records, url, key, limit=SHOPIFY_PAGE_LIMIT):
+    """Yield records one at a time across every page, decoding each page as it streams
+
+    stream_records(url, key) must return an iterable over the page's records,
+    empty on failure. A short page ends the walk.
+    """
+    page = 1
+    while True:
+        count = 0
+        for record in stream_records(page_url(url, page, limit), key):
+            count += 1
+            yield record
+
+        if count < limit:
+            return
+        page += 1
@@ -3,26 +3,38 @@
 Simple Python scraper for Bad Boujee Hair website using only standard libraries
 """
 
-import urllib.request
-import urllib.parse
+import argparse
 import json
 import re
 import time
 from datetime import datetime
 import html
+from shopify_pagination import iter_streamed_records, resource_key
+from http_pool import ConnectionPool
+from http_cache import ResponseCache
+from html_scanner import scan_html, srcset_urls
+from json_stream import iter_array_items
+from catalog_records import Product, Collection
+from image_index import ImageIndex
+
+DEFAULT_CACHE_DIR = '.scraper_cache/http'
 
 class SimpleBadBoujeeHairScraper:
-    def __init__(self):
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, cache_ttl=None):
         self.base_url = "https://www.badboujeehair.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Keep-alive connections shared by every request in the run
+        self.http = ConnectionPool(headers=self.headers, timeout=10)
+        # Conditional-request cache so unchanged responses come back as 304s
+        self.cache = ResponseCache(cache_dir, ttl=cache_ttl) if cache_dir else None
         
         self.data = {
             'site_info': {},
             'products': [],
             'categories': [],
-            'images': [],
+            'images': ImageIndex(),
             'metadata': {
                 'scraped_at': datetime.now().isoformat(),
                 'scraping_method': 'simple_python'
@@ -32,13 +44,72 @@ class SimpleBadBoujeeHairScraper:
     def make_request(self, url):
         """Make HTTP request with proper headers"""
         try:
-            req = urllib.request.Request(url, headers=self.headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return response.read().decode('utf-8')
+            if not self.cache:
+                with self.http.request(url) as response:
+                    if response.status != 200:
+                        print(f"❌ Error fetching {url}: HTTP {response.status} {response.reason}")
+                        return None
+                    return response.text()
+            
+            body = self.cache.fresh_body(url)
+            if body is not None:
+                return body.decode('utf-8')
+            
+            with self.http.request(url, headers=self.cache.conditional_headers(url)) as response:
+                if response.status == 304:
+                    response.read()
+                    body = self.cache.revalidated(url, response.headers)
+                    if body is not None:
+                        return body.decode('utf-8')
+                
+                if response.status != 200:
+                    print(f"❌ Error fetching {url}: HTTP {response.status} {response.reason}")
+                    return None
+                
+                body = response.read()
+                self.cache.store(url, body, response.headers)
+                return body.decode(response.headers.get_content_charset() or 'utf-8')
+        except Exception as e:
+            print(f"❌ Error fetching {url}: {e}")
+            return None
+    
+    def open_stream(self, url):
+        """Request a URL and return an iterator over its body chunks, or None on failure"""
+        try:
+            if self.cache:
+                chunks = self.cache.fresh_chunks(url)
+                if chunks is not None:
+                    return chunks
+            
+            headers = self.cache.conditional_headers(url) if self.cache else None
+            response = self.http.request(url, headers=headers)
+            if response.status == 304 and self.cache:
+                response.read()
+                chunks = self.cache.revalidated_chunks(url, response.headers)
+                if chunks is not None:
+                    return chunks
+            
+            if response.status != 200:
+                response.close()
+                print(f"❌ Error fetching {url}: HTTP {response.status} {response.reason}")
+                return None
+            
+            # iter_chunks releases the connection once the body has been read
+            chunks = response.iter_chunks()
+            if self.cache:
+                chunks = self.cache.store_chunks(url, chunks, response.headers)
+            return chunks
         except Exception as e:
             print(f"❌ Error fetching {url}: {e}")
             return None
     
+    def stream_records(self, url, key):
+        """Decode the records of one API page straight from the response stream"""
+        chunks = self.open_stream(url)
+        if chunks is None:
+            return []
+        return iter_array_items(chunks, key)
+    
     def scrape_shopify_api(self):
         """Scrape Shopify API endpoints"""
         print("🛒 Scraping Shopify API endpoints...")
@@ -50,22 +121,18 @@ class SimpleBadBoujeeHairScraper:
         
         for endpoint in endpoints:
             url = self.base_url + endpoint
+            key = resource_key(endpoint)
             print(f"  └─ Trying {endpoint}...")
             
             try:
-                response_text = self.make_request(url)
-                if response_text:
-                    data = json.loads(response_text)
-                    
-                    if 'products' in data:
-                        print(f"    ✅ Found {len(data['products'])} products")
-                        for product in data['products']:
-                            self.process_product(product)
-                    
-                    if 'collections' in data:
-                        print(f"    ✅ Found {len(data['collections'])} collections")
-                        for collection in data['collections']:
-                            self.process_collection(collection)
+                process = self.process_product if key == 'products' else self.process_collection
+                count = 0
+                for record in iter_streamed_records(self.stream_records, url, key):
+                    process(record)
+                    count += 1
+                
+                if count:
+                    print(f"    ✅ Found {count} {key}")
                             
             except json.JSONDecodeError as e:
                 print(f"    ❌ JSON decode error for {endpoint}: {e}")
@@ -79,55 +146,17 @@ class SimpleBadBoujeeHairScraper:
         description = re.sub(r'<[^>]+>', '', description)  # Remove HTML tags
         description = html.unescape(description)  # Decode HTML entities
         
-        processed_product = {
-            'id': product.get('id'),
-            'title': product.get('title'),
-            'handle': product.get('handle'),
-            'description': description.strip(),
-            'vendor': product.get('vendor'),
-            'product_type': product.get('product_type'),
-            'created_at': product.get('created_at'),
-            'updated_at': product.get('updated_at'),
-            'published_at': product.get('published_at'),
-            'tags': product.get('tags', []),
-            'available': product.get('available'),
-            'variants': [],
-            'images': [],
-            'options': product.get('options', [])
-        }
-        
-        # Process variants
-        if 'variants' in product:
-            for variant in product['variants']:
-                variant_data = {
-                    'id': variant.get('id'),
-                    'title': variant.get('title'),
-                    'price': variant.get('price'),
-                    'compare_at_price': variant.get('compare_at_price'),
-                    'sku': variant.get('sku'),
-                    'inventory_quantity': variant.get('inventory_quantity'),
-                    'available': variant.get('available')
-                }
-                processed_product['variants'].append(variant_data)
+        processed_product = Product.from_api(product, description.strip())
         
-        # Process images
-        if 'images' in product:
-            for image in product['images']:
-                image_data = {
-                    'src': image.get('src'),
-                    'alt': image.get('alt', ''),
-                    'position': image.get('position')
-                }
-                processed_product['images'].append(image_data)
-                
-                # Add to global images
-                self.data['images'].append({
-                    'src': image_data['src'],
-                    'alt': image_data['alt'],
-                    'context': 'product',
-                    'product_id': product.get('id'),
-                    'product_title': product.get('title')
-                })
+        # Add to global images
+        for image in processed_product.images:
+            self.data['images'].add({
+                'src': image.src,
+                'alt': image.alt,
+                'context': 'product',
+                'product_id': processed_product.id,
+                'product_title': processed_product.title
+            })
         
         self.data['products'].append(processed_product)
     
@@ -137,17 +166,7 @@ class SimpleBadBoujeeHairScraper:
         description = re.sub(r'<[^>]+>', '', description)
         description = html.unescape(description)
         
-        processed_collection = {
-            'id': collection.get('id'),
-            'title': collection.get('title'),
-            'handle': collection.get('handle'),
-            'description': description.strip(),
-            'published_at': collection.get('published_at'),
-            'updated_at': collection.get('updated_at'),
-            'products_count': collection.get('products_count', 0)
-        }
-        
-        self.data['categories'].append(processed_collection)
+        self.data['categories'].append(Collection.from_api(collection, description.strip()))
     
     def scrape_homepage(self):
         """Scrape homepage HTML content"""
@@ -157,41 +176,38 @@ class SimpleBadBoujeeHairScraper:
         if not response_text:
             return
         
-        # Extract title
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', response_text, re.IGNORECASE | re.DOTALL)
-        if title_match:
-            self.data['site_info']['title'] = html.unescape(title_match.group(1).strip())
+        # Title, meta tags, images and JSON-LD in one linear pass
+        page = scan_html(response_text)
+        
+        if page.title:
+            self.data['site_info']['title'] = page.title
         
-        # Extract meta description
-        desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', response_text, re.IGNORECASE)
-        if desc_match:
-            self.data['site_info']['description'] = html.unescape(desc_match.group(1))
+        description = page.meta_content('description')
+        if description:
+            self.data['site_info']['description'] = description
         
-        # Extract images from HTML
-        img_pattern = r'<img[^>]*src=["\']([^"\']*)["\'][^>]*alt=["\']([^"\']*)["\']'
-        img_matches = re.findall(img_pattern, response_text, re.IGNORECASE)
+        meta = {}
+        for attrs in page.meta:
+            key = attrs.get('name') or attrs.get('property')
+            if key and key not in meta:
+                meta[key] = attrs.get('content', '')
+        self.data['site_info']['meta'] = meta
         
-        for src, alt in img_matches:
+        for img in page.images:
+            candidates = srcset_urls(img['srcset'])
+            src = img['src'] or img['data_src'] or (candidates[-1] if candidates else '')
             if not src.startswith('data:') and 'loading.gif' not in src:
-                # Make URL absolute
-                if src.startswith('//'):
-                    src = 'https:' + src
-                elif src.startswith('/'):
-                    src = self.base_url + src
-                elif not src.startswith('http'):
-                    src = self.base_url + '/' + src
-                
-                self.data['images'].append({
-                    'src': src,
-                    'alt': html.unescape(alt),
+                image = {
+                    'src': self.absolute_url(src),
+                    'alt': img['alt'],
                     'context': 'homepage'
-                })
+                }
+                if candidates:
+                    image['srcset'] = [self.absolute_url(url) for url in candidates]
+                self.data['images'].add(image)
         
         # Extract structured data
-        json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-        json_ld_matches = re.findall(json_ld_pattern, response_text, re.IGNORECASE | re.DOTALL)
-        
-        for json_content in json_ld_matches:
+        for json_content in page.json_ld:
             try:
                 structured_data = json.loads(json_content.strip())
                 if isinstance(structured_data, dict) and structured_data.get('@type') == 'Organization':
@@ -199,37 +215,35 @@ class SimpleBadBoujeeHairScraper:
             except json.JSONDecodeError:
                 continue
         
-        print(f"✅ Extracted homepage data and {len([img for img in self.data['images'] if img['context'] == 'homepage'])} images")
+        print(f"✅ Extracted homepage data and {self.data['images'].count('homepage')} images")
+    
+    def absolute_url(self, src):
+        """Make a page-relative image URL absolute"""
+        if src.startswith('//'):
+            return 'https:' + src
+        if src.startswith('/'):
+            return self.base_url + src
+        if not src.startswith('http'):
+            return self.base_url + '/' + src
+        return src
     
     def analyze_data(self):
         """Analyze scraped data"""
         print("🔍 Analyzing scraped data...")
         
-        # Remove duplicate images
-        unique_images = {}
-        for image in self.data['images']:
-            url = image['src']
-            if url not in unique_images:
-                unique_images[url] = image
-        
-        self.data['images'] = list(unique_images.values())
-        
         # Calculate statistics
         prices = []
         product_types = {}
         
         for product in self.data['products']:
             # Collect prices
-            for variant in product.get('variants', []):
-                try:
-                    price = float(variant.get('price', 0))
-                    if price > 0:
-                        prices.append(price)
-                except (ValueError, TypeError):
-                    pass
+            for variant in product.variants:
+                price = variant.price_value()
+                if price > 0:
+                    prices.append(price)
             
             # Count product types
-            ptype = product.get('product_type', 'Uncategorized')
+            ptype = product.product_type
             product_types[ptype] = product_types.get(ptype, 0) + 1
         
         # Store analysis
@@ -249,13 +263,21 @@ class SimpleBadBoujeeHairScraper:
         """Save scraped data to files"""
         print("💾 Saving scraped data...")
         
+        # Records are converted to this scraper's JSON schema once, here
+        exported = {
+            **self.data,
+            'products': [self.export_product(product) for product in self.data['products']],
+            'categories': [self.export_collection(collection) for collection in self.data['categories']],
+            'images': self.data['images'].as_list()
+        }
+        
         # Save main data file
         with open('python_scraped_data.json', 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+            json.dump(exported, f, indent=2, ensure_ascii=False)
         
         # Save products only
         with open('python_products_only.json', 'w', encoding='utf-8') as f:
-            json.dump(self.data['products'], f, indent=2, ensure_ascii=False)
+            json.dump(exported['products'], f, indent=2, ensure_ascii=False)
         
         # Save summary
         summary = {
@@ -272,6 +294,49 @@ class SimpleBadBoujeeHairScraper:
         
         print("✅ Data saved successfully!")
     
+    def export_product(self, product):
+        """Convert a Product record to this scraper's JSON schema"""
+        return {
+            'id': product.id,
+            'title': product.title,
+            'handle': product.handle,
+            'description': product.description,
+            'vendor': product.vendor,
+            'product_type': product.product_type,
+            'created_at': product.created_at,
+            'updated_at': product.updated_at,
+            'published_at': product.published_at,
+            'tags': list(product.tags),
+            'available': product.available,
+            'variants': [{
+                'id': variant.id,
+                'title': variant.title,
+                'price': variant.price,
+                'compare_at_price': variant.compare_at_price,
+                'sku': variant.sku,
+                'inventory_quantity': variant.inventory_quantity,
+                'available': variant.available
+            } for variant in product.variants],
+            'images': [{
+                'src': image.src,
+                'alt': image.alt,
+                'position': image.position
+            } for image in product.images],
+            'options': list(product.options)
+        }
+    
+    def export_collection(self, collection):
+        """Convert a Collection record to this scraper's JSON schema"""
+        return {
+            'id': collection.id,
+            'title': collection.title,
+            'handle': collection.handle,
+            'description': collection.description,
+            'published_at': collection.published_at,
+            'updated_at': collection.updated_at,
+            'products_count': collection.products_count
+        }
+    
     def run_scrape(self):
         """Run the complete scraping process"""
         start_time = time.time()
@@ -312,7 +377,21 @@ class SimpleBadBoujeeHairScraper:
             print(f"❌ Critical error: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.http.close()
+            if self.cache:
+                self.cache.save()
+                print(f"🗄️ Cache: {self.cache.stats}")
 
 if __name__ == "__main__":
-    scraper = SimpleBadBoujeeHairScraper()
+    parser = argparse.ArgumentParser(description="Simple Bad Boujee Hair scraper")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="HTTP response cache directory")
+    parser.add_argument('--cache-ttl', type=float, help="Serve cached responses younger than this many seconds without revalidating")
+    parser.add_argument('--no-cache', action='store_true', help="Disable the HTTP response cache")
+    args = parser.parse_args()
+    
+    scraper = SimpleBadBoujeeHairScraper(
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_ttl=args.cache_ttl
+    )
     scraper.run_scrape()
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Compressed, content-hashed archive of rendered page HTML (standard library only)
+
+Every rendered page_source is gzip-compressed and stored under the SHA-256
+of its content, so identical renders are kept once. A JSON index maps each
+URL to its latest snapshot, page type and the extractors that ran on it, so
+extractors can later be re-run offline without a browser.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class SnapshotArchive:
+    """URL-indexed store of gzip-compressed, content-addressed HTML snapshots"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def add(self, url, page_type, extractors, html):
+        """Archive a rendered page, reusing the stored object if the content is unchanged"""
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+
+        if not os.path.exists(path):
+            temp_path = f"{path}.tmp.{threading.get_ident()}"
+            with gzip.open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+        with self._lock:
+            self.index[url] = {
+                'sha256': digest,
+                'page_type': page_type,
+                'extractors': sorted(extractors),
+                'captured_at': datetime.now().isoformat()
+            }
+
+    def read(self, url):
+        """Return the archived HTML for a URL"""
+        with gzip.open(self._object_path(self.index[url]['sha256']), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def __iter__(self):
+        """Yield (url, entry) for every archived page"""
+        with self._lock:
+            entries = list(self.index.items())
+        return iter(entries)
+
+    def __len__(self):
+        return len(self.index)
+
+    def save(self):
+        """Persist the URL index"""
+        with self._lock:
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2)
+            os.replace(temp_path, self.index_path)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, f"{digest}.html.gz")
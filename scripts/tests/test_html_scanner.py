@@ -0,0 +1,31 @@
+from html_scanner import scan_html
+
+
+def test_images_inside_noscript_fallbacks_are_found():
+    page = ('<img class="lazyload" data-src="/files/hero.jpg">'
+            '<noscript><img src="/files/hero.jpg" alt="Hero"></noscript>'
+            '<NOSCRIPT><img src="/files/logo.png"></NOSCRIPT><title>Home</title>')
+    scan = scan_html(page)
+
+    assert [(image['src'], image['data_src']) for image in scan.images] == [
+        ('', '/files/hero.jpg'), ('/files/hero.jpg', ''), ('/files/logo.png', '')
+    ]
+    assert scan.title == 'Home'
+
+
+def test_script_content_is_not_scanned_as_markup():
+    scan = scan_html('<script>document.write("<img src=/x.jpg>")</script><img src="/y.jpg">')
+    assert [image['src'] for image in scan.images] == ['/y.jpg']
+
+
+def test_apostrophe_in_unquoted_value_does_not_open_a_quote():
+    scan = scan_html('<div data-note=it\'s>x</div><img src="/a.jpg"><img src="/b.jpg"><p>Don\'t</p><img src="/c.jpg">')
+    assert [image['src'] for image in scan.images] == ['/a.jpg', '/b.jpg', '/c.jpg']
+
+    scan = scan_html("<a data-x=1'2 href=/>y</a><img src=/d.jpg>")
+    assert [image['src'] for image in scan.images] == ['/d.jpg']
+
+
+def test_quoted_values_may_contain_angle_brackets():
+    scan = scan_html('<img alt="a > b" src = \'/e.jpg\'><img src="/f.jpg">')
+    assert [(image['src'], image['alt']) for image in scan.images] == [('/e.jpg', 'a > b'), ('/f.jpg', '')]
@@ -0,0 +1,50 @@
+from image_index import ImageIndex, canonical_image_url
+from python_scraper import BadBoujeeHairScraper
+
+
+def null_src_product():
+    return {
+        'id': 1,
+        'title': 'Gift Cards',
+        'handle': 'gift-cards',
+        'body_html': '<p>Gift card</p>',
+        'variants': [{'id': 11, 'title': 'Default', 'price': '50.00'}],
+        'images': [
+            {'id': 21, 'src': None, 'position': 1},
+            {'id': 22, 'src': 'https://cdn.shopify.com/s/files/1/products/card_800x.png?v=1', 'position': 2}
+        ]
+    }
+
+
+def test_canonical_url_drops_size_suffix_scheme_and_cache_buster():
+    assert canonical_image_url('//cdn.shopify.com/s/files/1/a_800x.jpg?v=12') == 'cdn.shopify.com/s/files/1/a.jpg'
+    assert canonical_image_url('http://CDN.shopify.com/s/files/1/a.jpg') == 'cdn.shopify.com/s/files/1/a.jpg'
+
+
+def test_add_skips_images_without_src():
+    index = ImageIndex()
+    assert index.add({'src': None, 'context': 'product'}) is False
+    assert index.add({'src': '', 'context': 'product'}) is False
+    assert len(index) == 0
+
+
+def test_product_with_null_image_src_is_processed():
+    scraper = BadBoujeeHairScraper(cache_dir=None, api_only=True)
+    scraper.process_product(null_src_product())
+
+    assert len(scraper.data['products']) == 1
+    images = scraper.data['images'].as_list()
+    assert [image['src'] for image in images] == ['https://cdn.shopify.com/s/files/1/products/card_800x.png?v=1']
+    assert scraper.export_data()['products'][0]['images'][0]['src'] is None
+
+
+def test_duplicate_keeps_largest_rendition():
+    index = ImageIndex()
+    index.add({'src': '/x_100x.jpg', 'context': 'homepage'})
+    index.add({'src': '/x_1200x.jpg', 'context': 'homepage'})
+    index.add({'src': '/x_grande.jpg', 'context': 'homepage'})
+    assert [image['src'] for image in index] == ['/x_1200x.jpg']
+
+    index.add({'src': '/x.jpg?v=2', 'context': 'product', 'product_id': 1})
+    assert [image['src'] for image in index] == ['/x.jpg?v=2']
+    assert index.count('homepage') == 1
@@ -0,0 +1,32 @@
+import json
+
+from python_scraper import BadBoujeeHairScraper, SCRAPING_METHOD
+
+
+def write_previous(tmp_path, metadata):
+    path = tmp_path / 'python_scraped_data.json'
+    product = {'id': 1, 'handle': 'wig', 'updated_at': '2024-01-01T00:00:00-05:00', 'variants': []}
+    path.write_text(json.dumps({'products': [product], 'metadata': metadata}))
+    return str(path)
+
+
+def scraper():
+    return BadBoujeeHairScraper(cache_dir=None, api_only=True)
+
+
+def test_previous_output_from_simple_scraper_is_ignored(tmp_path):
+    s = scraper()
+    s.load_previous_run(write_previous(tmp_path, {'scraping_method': 'simple_python'}))
+    assert s.previous_products == {}
+
+
+def test_previous_output_from_this_scraper_is_reused(tmp_path):
+    s = scraper()
+    s.load_previous_run(write_previous(tmp_path, {'scraping_method': SCRAPING_METHOD}))
+    assert list(s.previous_products) == [1]
+
+
+def test_previous_output_with_watermark_is_reused(tmp_path):
+    s = scraper()
+    s.load_previous_run(write_previous(tmp_path, {'watermark': '2024-01-01T00:00:00-05:00'}))
+    assert list(s.previous_products) == [1]
@@ -0,0 +1,49 @@
+import json
+import random
+
+import pytest
+
+from json_stream import iter_array_items
+
+DOCUMENT = {
+    'count': 3,
+    'products': [
+        1.5, -2e10, 0.25E-3, 1, 0, -0.0, 12345678901234567890, True, False, None,
+        'plain', 'esc\\"aped\\n', 'ünïcødé ✂ 💇', '',
+        {'id': 7, 'price': '89.00', 'weight': 0.2, 'tags': ['a', 'b'], 'nested': {'x': [1e-7, 3.25]}},
+        [], {}, [[1.0, 2.5], [3e2]]
+    ],
+    'trailer': {'done': True}
+}
+
+
+def chunked(data, sizes):
+    pos = 0
+    for size in sizes:
+        yield data[pos:pos + size]
+        pos += size
+    if pos < len(data):
+        yield data[pos:]
+
+
+def test_number_split_after_decimal_point():
+    assert list(iter_array_items([b'{"products":[1.', b'5]}'], 'products')) == [1.5]
+
+
+def test_number_split_after_exponent_marker():
+    assert list(iter_array_items([b'{"products":[2e', b'3, 4]}'], 'products')) == [2e3, 4]
+
+
+@pytest.mark.parametrize('separators', [(',', ':'), (', ', ': ')])
+def test_every_single_split_point(separators):
+    data = json.dumps(DOCUMENT, ensure_ascii=False, separators=separators).encode('utf-8')
+    for cut in range(1, len(data)):
+        assert list(iter_array_items([data[:cut], data[cut:]], 'products')) == DOCUMENT['products'], cut
+
+
+def test_random_chunk_boundaries():
+    rng = random.Random(1234)
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+    for _ in range(500):
+        sizes = [rng.randint(1, 12) for _ in range(len(data))]
+        assert list(iter_array_items(chunked(data, sizes), 'products')) == DOCUMENT['products']